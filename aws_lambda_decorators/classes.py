@@ -88,7 +88,8 @@ class ValidatedParameter:
                 RegexValidator(my_regex), ...)
         """
         self._func_param_name = func_param_name
-        self._validators = validators
+        self._validations = [(validator.validate, ValidatedParameter.get_message_function(validator))
+                             for validator in validators or []]
 
     @property
     def func_param_name(self):
@@ -114,18 +115,29 @@ class ValidatedParameter:
         """
         errors = []
 
-        if self._validators:
-            for validator in self._validators:
-                if not validator.validate(value):
-                    if hasattr(validator, "_error_message"):
-                        errors.append(validator.message(value))
-                    else:  # calling the validator statically
-                        errors.append(validator.ERROR_MESSAGE.format(value=value))
-                    if not group_errors:
-                        return errors
+        for validate, message in self._validations:
+            if not validate(value):
+                errors.append(message(value))
+                if not group_errors:
+                    return errors
 
         return errors
 
+    @staticmethod
+    def get_message_function(validator):
+        """
+        Gets the function that formats the error message of a validator.
+
+        Args:
+            validator (Validator|type): a validator instance, or a validator class used statically
+
+        Returns:
+            A function taking the validated value
+        """
+        if isinstance(validator, type) or not hasattr(validator, "_error_message"):  # calling the validator statically
+            return lambda value: validator.ERROR_MESSAGE.format(value=value)
+        return validator.message
+
 
 class Parameter(ValidatedParameter, BaseParameter):
     """Class used to encapsulate the extract methods parameter data."""
@@ -157,6 +169,7 @@ class Parameter(ValidatedParameter, BaseParameter):
             transform (function): Optional, a function to apply to the extracted value before checking validation rules.
         """
         self._path = path
+        self._path_segments = None
         self._default = default
         self._transform = transform
         ValidatedParameter.__init__(self, func_param_name, validators)
@@ -179,15 +192,21 @@ class Parameter(ValidatedParameter, BaseParameter):
         Returns:
             The extracted value
         """
-        for path_key in filter(lambda item: item != "", self._path.split(PATH_DIVIDER)):
-            real_key, annotation = Parameter.get_annotations_from_key(path_key)
+        if self._path_segments is None:
+            self._path_segments = [Parameter.get_annotations_from_key(item)
+                                   for item in self._path.split(PATH_DIVIDER) if item != ""]
+
+        if not self._path_segments:
+            raise ValueError(self._path)
+
+        for real_key, annotation in self._path_segments:
             if dict_value and real_key in dict_value:
                 dict_value = decode(annotation, dict_value[real_key])
             else:
                 dict_value = self._default
 
         if not self._name:
-            self._name = real_key
+            self._name = self._path_segments[-1][0]
 
         if dict_value and self._transform:
             dict_value = self._transform(dict_value)
@@ -206,11 +225,9 @@ class Parameter(ValidatedParameter, BaseParameter):
         Returns:
             A list of validation key/pair errors
         """
-        key = self._path.split(PATH_DIVIDER)[-1]
-
         errors = self.validate(value, group_errors)
 
-        return {key: errors} if errors else {}
+        return {self._path.split(PATH_DIVIDER)[-1]: errors} if errors else {}
 
     @staticmethod
     def get_annotations_from_key(key):
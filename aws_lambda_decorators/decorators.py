@@ -30,6 +30,20 @@ HSTS_NON_DICT_ERROR = "Invalid response type for HSTS header"
 UNKNOWN = "Unknown"
 
 
+def _validation_failure(errors):
+    """
+    Logs a set of validation errors and builds the error response returned to the caller.
+
+    Args:
+        errors (list): a list of validation errors
+
+    Returns:
+        An object that contains the status code and the list of errors
+    """
+    LOGGER.error(VALIDATE_ERROR_MESSAGE, errors)
+    return failure(errors)
+
+
 def extract_from_event(parameters, group_errors=False, allow_none_defaults=False):
     """
     Extracts a set of parameters from the event dictionary in a lambda handler.
@@ -104,8 +118,7 @@ def extract(parameters, group_errors=False, allow_none_defaults=False):
                     if param_errors:
                         errors.append(param_errors)
                         if not group_errors:
-                            LOGGER.error(VALIDATE_ERROR_MESSAGE, errors)
-                            return failure(errors)
+                            return _validation_failure(errors)
                     elif allow_none_defaults or return_val is not None:
                         kwargs[param.get_var_name()] = return_val
             except Exception as ex:  # noqa: pylint - broad-except
@@ -115,8 +128,7 @@ def extract(parameters, group_errors=False, allow_none_defaults=False):
                 return failure(ERROR_MESSAGE)
             else:
                 if group_errors and errors:
-                    LOGGER.error(VALIDATE_ERROR_MESSAGE, errors)
-                    return failure(errors)
+                    return _validation_failure(errors)
 
                 return func(*args, **kwargs)
         return wrapper
@@ -248,15 +260,13 @@ def validate(parameters, group_errors=False):
                     if param_errors:
                         errors.append({param.func_param_name: param_errors})
                         if not group_errors:
-                            LOGGER.error(VALIDATE_ERROR_MESSAGE, errors)
-                            return failure(errors)
+                            return _validation_failure(errors)
             except Exception as ex:  # noqa: pylint - broad-except
                 LOGGER.error(EXCEPTION_LOG_MESSAGE_PATHLESS, full_name(ex), str(ex), param.func_param_name)
                 return failure(ERROR_MESSAGE)
 
             if group_errors and errors:
-                LOGGER.error(VALIDATE_ERROR_MESSAGE, errors)
-                return failure(errors)
+                return _validation_failure(errors)
 
             return func(*args, **kwargs)
         return wrapper
@@ -19,6 +19,7 @@ CURRENCIES = {"LKR", "ETB", "RWF", "NZD", "SBD", "MKD", "NPR", "LAK", "KWD", "IN
 
 class Validator:  # noqa: pylint - too-few-public-methods
     """Validation rule to check if the given mandatory value exists."""
+    __slots__ = ("_error_message", "_condition")
     ERROR_MESSAGE = "Unknown error"
 
     def __init__(self, error_message, condition=None):
@@ -47,6 +48,7 @@ class Validator:  # noqa: pylint - too-few-public-methods
 
 class Mandatory(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if the given mandatory value exists."""
+    __slots__ = ()
     ERROR_MESSAGE = "Missing mandatory value"
 
     def __init__(self, error_message=None):
@@ -71,6 +73,7 @@ class Mandatory(Validator):  # noqa: pylint - too-few-public-methods
 
 class RegexValidator(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if a value matches a regular expression."""
+    __slots__ = ("_regexp",)
     ERROR_MESSAGE = "'{value}' does not conform to regular expression '{condition}'"
 
     def __init__(self, regex="", error_message=None):
@@ -99,6 +102,7 @@ class RegexValidator(Validator):  # noqa: pylint - too-few-public-methods
 
 class SchemaValidator(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if a value matches a regular expression."""
+    __slots__ = ("_validate_schema",)
     ERROR_MESSAGE = "'{value}' does not validate against schema '{condition}'"
 
     def __init__(self, schema, error_message=None):
@@ -110,6 +114,7 @@ class SchemaValidator(Validator):  # noqa: pylint - too-few-public-methods
             error_message (str): A custom error message to output if validation fails
         """
         super().__init__(error_message, schema)
+        self._validate_schema = schema.validate
 
     def validate(self, value=None):
         """
@@ -122,13 +127,14 @@ class SchemaValidator(Validator):  # noqa: pylint - too-few-public-methods
             if value is None:
                 return True
 
-            return self._condition.validate(value) == value
+            return self._validate_schema(value) == value
         except SchemaError:
             return False
 
 
 class Minimum(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if a value is greater than a minimum value."""
+    __slots__ = ()
     ERROR_MESSAGE = "'{value}' is less than minimum value '{condition}'"
 
     def __init__(self, minimum: (float, int), error_message=None):
@@ -159,6 +165,7 @@ class Minimum(Validator):  # noqa: pylint - too-few-public-methods
 
 class Maximum(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if a value is less than a maximum value."""
+    __slots__ = ()
     ERROR_MESSAGE = "'{value}' is greater than maximum value '{condition}'"
 
     def __init__(self, maximum: (float, int), error_message=None):
@@ -189,6 +196,7 @@ class Maximum(Validator):  # noqa: pylint - too-few-public-methods
 
 class MinLength(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if a string is shorter than a minimum length."""
+    __slots__ = ()
     ERROR_MESSAGE = "'{value}' is shorter than minimum length '{condition}'"
 
     def __init__(self, min_length: int, error_message=None):
@@ -216,6 +224,7 @@ class MinLength(Validator):  # noqa: pylint - too-few-public-methods
 
 class MaxLength(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if a string is longer than a maximum length."""
+    __slots__ = ()
     ERROR_MESSAGE = "'{value}' is longer than maximum length '{condition}'"
 
     def __init__(self, max_length: int, error_message=None):
@@ -242,6 +251,7 @@ class MaxLength(Validator):  # noqa: pylint - too-few-public-methods
 
 
 class Type(Validator):
+    __slots__ = ()
     ERROR_MESSAGE = "'{value}' is not of type '{condition.__name__}'"
 
     def __init__(self, valid_type: type, error_message=None):
@@ -268,6 +278,7 @@ class Type(Validator):
 
 
 class EnumValidator(Validator):
+    __slots__ = ("_valid_values",)
     ERROR_MESSAGE = "'{value}' is not in list '{condition}'"
 
     def __init__(self, *args: list, error_message=None):
@@ -279,6 +290,10 @@ class EnumValidator(Validator):
             args (list): The list of valid values
         """
         super().__init__(error_message, args)
+        try:
+            self._valid_values = frozenset(args)
+        except TypeError:  # unhashable valid values
+            self._valid_values = args
 
     def validate(self, value=None):
         """
@@ -290,11 +305,15 @@ class EnumValidator(Validator):
         if value is None:
             return True
 
-        return value in self._condition
+        try:
+            return value in self._valid_values
+        except TypeError:  # unhashable value
+            return value in self._condition
 
 
 class NonEmpty(Validator):  # noqa: pylint - too-few-public-methods
     """Validation rule to check if the given value is empty."""
+    __slots__ = ()
     ERROR_MESSAGE = "Value is empty"
 
     def __init__(self, error_message=None):
@@ -322,6 +341,7 @@ class NonEmpty(Validator):  # noqa: pylint - too-few-public-methods
 
 class DateValidator(Validator):
     """Validation rule to check if a string is a valid date according to some format."""
+    __slots__ = ()
     ERROR_MESSAGE = "'{value}' is not a '{condition}' date"
 
     def __init__(self, date_format: str, error_message=None):
@@ -354,6 +374,7 @@ class DateValidator(Validator):
 
 class CurrencyValidator(Validator):
     """Validation rule to check if a string is a valid currency according to ISO 4217 Currency Code."""
+    __slots__ = ()
     ERROR_MESSAGE = "'{value}' is not a valid currency code."
 
     def __init__(self, error_message=None):
@@ -0,0 +1,10 @@
+class LogSpy:
+
+    def __init__(self):
+        self.calls = []
+
+    def error(self, *args):
+        self.calls.append(("error", *args))
+
+    def info(self, *args):
+        self.calls.append(("info", *args))
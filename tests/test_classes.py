@@ -1,5 +1,33 @@
 import unittest
 from aws_lambda_decorators.classes import Parameter, SSMParameter, BaseParameter
+from aws_lambda_decorators.validators import Validator
+
+
+class Even(Validator):
+
+    def validate(self, value=None):
+        return value % 2 == 0
+
+    def message(self, val=None):  # noqa: pylint - arguments-renamed
+        return f"'{val}' is not even"
+
+
+class NoMessageValidator:  # noqa: pylint - too-few-public-methods
+    ERROR_MESSAGE = "'{value}' is not positive"
+
+    @staticmethod
+    def validate(value=None):
+        return value > 0
+
+
+class NoInitValidator(Validator):
+    ERROR_MESSAGE = "'{value}' is not positive"
+
+    def __init__(self):  # noqa: pylint - super-init-not-called
+        pass
+
+    def validate(self, value=None):
+        return value > 0
 
 
 class ParamTests(unittest.TestCase):
@@ -11,11 +39,28 @@ class ParamTests(unittest.TestCase):
     def test_annotations_from_key_returns_annotation(self):
         key = "simple[annotation]"
         response = Parameter.get_annotations_from_key(key)
-        self.assertTrue(response[0] == "simple")
-        self.assertTrue(response[1] == "annotation")
+        self.assertEqual("simple", response[0])
+        self.assertEqual("annotation", response[1])
 
     def test_can_not_add_non_pythonic_var_name_to_ssm_parameter(self):
         param = SSMParameter("tests", "with space")
 
         with self.assertRaises(SyntaxError):
             param.get_var_name()
+
+    def test_custom_validator_message_is_called_positionally(self):
+        param = Parameter("/a", validators=[Even(None)])
+
+        self.assertEqual(["'3' is not even"], param.validate(3, False))
+
+    def test_can_create_parameter_with_validator_without_message(self):
+        param = Parameter("/a", validators=[NoMessageValidator()])
+
+        self.assertEqual([], param.validate(1, False))
+
+    def test_validator_without_error_message_uses_static_error_message(self):
+        for validator in (NoMessageValidator(), NoInitValidator()):
+            with self.subTest(validator=validator):
+                param = Parameter("/a", validators=[validator])
+
+                self.assertEqual(["'-1' is not positive"], param.validate(-1, False))
@@ -1,33 +1,42 @@
 # pylint:disable=no-self-use
 import json
+from pathlib import Path
 import unittest
 from unittest.mock import patch
+import jwt
 from aws_lambda_decorators.decoders import decode, decode_json, decode_jwt
 from aws_lambda_decorators.decorators import extract
 from aws_lambda_decorators.classes import Parameter
+from tests.log_spy import LogSpy
 
 
-TEST_JWT = "eyJraWQiOiJEQlwvK0lGMVptekNWOGNmRE1XVUxBRlBwQnVObW5CU2NcL2RoZ3pnTVhcL2NzPSIsImFsZyI6IlJTMjU2In0." \
-           "eyJzdWIiOiJhYWRkMWUwZS01ODA3LTQ3NjMtYjFlOC01ODIzYmY2MzFiYjYiLCJhdWQiOiIycjdtMW1mdWFiODg3ZmZvdG9iNWFjcX" \
-           "Q2aCIsImNvZ25pdG86Z3JvdXBzIjpbIkRBU0gtQ3VzdG9tZXIiXSwiZW1haWxfdmVyaWZpZWQiOnRydWUsImV2ZW50X2lkIjoiZDU4" \
-           "NzU0ZjUtMTdlMC0xMWU5LTg2NzAtMjVkOTNhNWNiMjAwIiwidG9rZW5fdXNlIjoiaWQiLCJhdXRoX3RpbWUiOjE1NDc0NTkwMDMsIm" \
-           "lzcyI6Imh0dHBzOlwvXC9jb2duaXRvLWlkcC5ldS13ZXN0LTIuYW1hem9uYXdzLmNvbVwvZXUtd2VzdC0yX1B4bEdzMU11SiIsImNv" \
-           "Z25pdG86dXNlcm5hbWUiOiJhYWRkMWUwZS01ODA3LTQ3NjMtYjFlOC01ODIzYmY2MzFiYjYiLCJleHAiOjE1NDc0NjI2MDMsImlhdC" \
-           "I6MTU0NzQ1OTAwMywiZW1haWwiOiJjdXN0b21lckBleGFtcGxlLmNvbSJ9.CNSDu4a9azT40maHAF9tnQTWbfEeiTZ9PfkR9_RU_VG" \
-           "4QTA1y4R0F2zWVpsa3CkVMq4Uv2NWOwG6zXf-7XaWTEjoGOQR07sq54IEWU3WIxgkgtRAI-aR7nIvllMXXR0RE3e5jzn5SmefG1j-O" \
-           "NYiD1yYExrKOEMPJVgkdYG6x2cBiucHihVliJQUf9u-ebpu2Cpm_ACvUTUilB6sBL06D3sRobvNLbNNnSjsA66ULNpPTPOVYJxhFbu" \
-           "ceQ1EICp0oICw2ncJch78RAFY5TeqiVa-uBybxwd36zJmZkXeJPWAKd32IOIJXNUyDOJtmXtSQW51pZGYTsihjZHz3kNlfg"
+TEST_JWT = (Path(__file__).parent / "fixtures" / "test_jwt.txt").read_text().strip()
+
+EXTRACT_ERROR_BODY = {"message": "Error extracting parameters"}
 
 
 class DecodersTests(unittest.TestCase):
 
-    @patch("aws_lambda_decorators.decoders.LOGGER")
-    def test_decode_function_missing_logs_error(self, mock_logger):
+    @patch("aws_lambda_decorators.decoders.LOGGER", new_callable=LogSpy)
+    def test_decode_function_missing_logs_error(self, log_spy):
         decode("[random]", None)
-        mock_logger.error.assert_called_once_with("Missing decode function for annotation: %s", "[random]")
+        self.assertEqual([("error", "Missing decode function for annotation: %s", "[random]")], log_spy.calls)
+
+    def test_decode_jwt_returns_cached_claims_on_repeated_calls(self):
+        token = jwt.encode({"sub": "cached"}, "secret").decode()
+
+        initial_cache_info = decode_jwt.cache_info()
+
+        first_claims = decode_jwt(token)
+        second_claims = decode_jwt(token)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_returns_400_on_json_decode_error(self, mock_logger):
+        self.assertEqual({"sub": "cached"}, first_claims)
+        self.assertIs(first_claims, second_claims)
+        self.assertEqual(decode_jwt.cache_info().hits, initial_cache_info.hits + 1)
+        self.assertEqual(decode_jwt.cache_info().misses, initial_cache_info.misses + 1)
+
+    @patch("aws_lambda_decorators.decorators.LOGGER", new_callable=LogSpy)
+    def test_extract_returns_400_on_json_decode_error(self, log_spy):
         path = "/a/b[json]/c"
         dictionary = {
             "a": {
@@ -42,17 +51,19 @@ class DecodersTests(unittest.TestCase):
         response = handler(dictionary, None)
 
         self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": \"Error extracting parameters\"}", response["body"])
+        self.assertEqual(EXTRACT_ERROR_BODY, json.loads(response["body"]))
 
-        mock_logger.error.assert_called_once_with(
+        self.assertEqual([(
+            "error",
             "%s: %s in argument %s for path %s",
             "json.decoder.JSONDecodeError",
             "Expecting property name enclosed in double quotes: line 1 column 2 (char 1)",
             "event",
-            "/a/b[json]/c")
+            "/a/b[json]/c"
+        )], log_spy.calls)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_returns_400_on_jwt_decode_error(self, mock_logger):
+    @patch("aws_lambda_decorators.decorators.LOGGER", new_callable=LogSpy)
+    def test_extract_returns_400_on_jwt_decode_error(self, log_spy):
         path = "/a/b[jwt]/c"
         dictionary = {
             "a": {
@@ -67,14 +78,16 @@ class DecodersTests(unittest.TestCase):
         response = handler(dictionary, None)
 
         self.assertEqual(400, response["statusCode"])
-        self.assertTrue("{\"message\": \"Error extracting parameters\"}" in response["body"])
+        self.assertEqual(EXTRACT_ERROR_BODY, json.loads(response["body"]))
 
-        mock_logger.error.assert_called_once_with(
+        self.assertEqual([(
+            "error",
             "%s: %s in argument %s for path %s",
             "jwt.exceptions.DecodeError",
             "Not enough segments",
             "event",
-            "/a/b[jwt]/c")
+            "/a/b[jwt]/c"
+        )], log_spy.calls)
 
     def test_extracts_from_list_by_index_annotation_successfully(self):
         path = "/a/b[1]/c"
@@ -99,8 +112,8 @@ class DecodersTests(unittest.TestCase):
 
         self.assertEqual(3, response)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extracts_from_list_by_index_out_of_range_fails_with_400(self, mock_logger):
+    @patch("aws_lambda_decorators.decorators.LOGGER", new_callable=LogSpy)
+    def test_extracts_from_list_by_index_out_of_range_fails_with_400(self, log_spy):
         path = "/a/b[4]/c"
         dictionary = {
             "a": {
@@ -122,14 +135,22 @@ class DecodersTests(unittest.TestCase):
         response = handler(dictionary, None)
 
         self.assertEqual(400, response["statusCode"])  # noqa
-        self.assertTrue("{\"message\": \"Error extracting parameters\"}" in response["body"])  # noqa
+        self.assertEqual(EXTRACT_ERROR_BODY, json.loads(response["body"]))
 
-        mock_logger.error.assert_called_once_with(
+        self.assertEqual([(
+            "error",
             "%s: %s in argument %s for path %s",
             "IndexError",
             "list index out of range",
             "event",
-            "/a/b[4]/c")
+            "/a/b[4]/c"
+        )], log_spy.calls)
+
+    def test_can_reuse_annotated_parameter_to_extract_from_different_dicts(self):
+        param = Parameter("/a[json]/b[1]")
+
+        self.assertEqual(2, param.extract_value({"a": json.dumps({"b": [1, 2]})}))
+        self.assertEqual(4, param.extract_value({"a": json.dumps({"b": [3, 4]})}))
 
     def test_extract_multiple_parameters_from_json_hits_cache(self):
         dictionary = {
@@ -159,6 +180,7 @@ class DecodersTests(unittest.TestCase):
             "a": TEST_JWT
         }
 
+        decode_jwt.cache_clear()
         initial_cache_info = decode_jwt.cache_info()
 
         @extract([
@@ -1,14 +1,17 @@
 # pylint:disable=too-many-lines
+import base64
 from http import HTTPStatus
 import json
 from json import JSONDecodeError
+from pathlib import Path
+from types import MappingProxyType
 import unittest
-from unittest.mock import patch, MagicMock
-from uuid import uuid4
+from unittest.mock import patch
 
 from botocore.exceptions import ClientError
 from schema import Schema, And, Optional
 
+from aws_lambda_decorators import decorators
 from aws_lambda_decorators.classes import ExceptionHandler, Parameter, SSMParameter, ValidatedParameter
 from aws_lambda_decorators.decorators import extract, extract_from_event, extract_from_context, handle_exceptions, \
     log, response_body_as_json, extract_from_ssm, validate, handle_all_exceptions, cors, push_ws_errors, \
@@ -16,47 +19,169 @@ from aws_lambda_decorators.decorators import extract, extract_from_event, extrac
 from aws_lambda_decorators.utils import get_websocket_endpoint
 from aws_lambda_decorators.validators import Mandatory, RegexValidator, SchemaValidator, Minimum, Maximum, MaxLength, \
     MinLength, Type, EnumValidator, NonEmpty, DateValidator, CurrencyValidator
+from tests.log_spy import LogSpy
 
-TEST_JWT = "eyJraWQiOiJEQlwvK0lGMVptekNWOGNmRE1XVUxBRlBwQnVObW5CU2NcL2RoZ3pnTVhcL2NzPSIsImFsZyI6IlJTMjU2In0." \
-           "eyJzdWIiOiJhYWRkMWUwZS01ODA3LTQ3NjMtYjFlOC01ODIzYmY2MzFiYjYiLCJhdWQiOiIycjdtMW1mdWFiODg3ZmZvdG9iNWFjcX" \
-           "Q2aCIsImNvZ25pdG86Z3JvdXBzIjpbIkRBU0gtQ3VzdG9tZXIiXSwiZW1haWxfdmVyaWZpZWQiOnRydWUsImV2ZW50X2lkIjoiZDU4" \
-           "NzU0ZjUtMTdlMC0xMWU5LTg2NzAtMjVkOTNhNWNiMjAwIiwidG9rZW5fdXNlIjoiaWQiLCJhdXRoX3RpbWUiOjE1NDc0NTkwMDMsIm" \
-           "lzcyI6Imh0dHBzOlwvXC9jb2duaXRvLWlkcC5ldS13ZXN0LTIuYW1hem9uYXdzLmNvbVwvZXUtd2VzdC0yX1B4bEdzMU11SiIsImNv" \
-           "Z25pdG86dXNlcm5hbWUiOiJhYWRkMWUwZS01ODA3LTQ3NjMtYjFlOC01ODIzYmY2MzFiYjYiLCJleHAiOjE1NDc0NjI2MDMsImlhdC" \
-           "I6MTU0NzQ1OTAwMywiZW1haWwiOiJjdXN0b21lckBleGFtcGxlLmNvbSJ9.CNSDu4a9azT40maHAF9tnQTWbfEeiTZ9PfkR9_RU_VG" \
-           "4QTA1y4R0F2zWVpsa3CkVMq4Uv2NWOwG6zXf-7XaWTEjoGOQR07sq54IEWU3WIxgkgtRAI-aR7nIvllMXXR0RE3e5jzn5SmefG1j-O" \
-           "NYiD1yYExrKOEMPJVgkdYG6x2cBiucHihVliJQUf9u-ebpu2Cpm_ACvUTUilB6sBL06D3sRobvNLbNNnSjsA66ULNpPTPOVYJxhFbu" \
-           "ceQ1EICp0oICw2ncJch78RAFY5TeqiVa-uBybxwd36zJmZkXeJPWAKd32IOIJXNUyDOJtmXtSQW51pZGYTsihjZHz3kNlfg"
+TEST_JWT = (Path(__file__).parent / "fixtures" / "test_jwt.txt").read_text().strip()
 
+TEST_JWT_CLAIMS = json.loads(base64.urlsafe_b64decode(TEST_JWT.split(".")[1] + "=="))
 
-class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-methods
+EXTRACT_ERROR_BODY = {"message": "Error extracting parameters"}
+
+DIGITS_REGEX = RegexValidator(r"\d+")
+NUMBER_REGEX = RegexValidator(r"[0-9]+")
+AB_REGEX = RegexValidator(r"[ab]+")
+MINIMUM_10 = Minimum(10.0)
+MAXIMUM_100 = Maximum(100.0)
+
+DICT_B_SCHEMA = Schema({"b": And(dict, {"c": str})})
+INT_G_SCHEMA = Schema({"g": int})
+OPTIONAL_J_SCHEMA_VALIDATOR = SchemaValidator(Schema(
+    {
+        "b": And(dict, {
+            "c": str
+        }),
+        Optional("j"): str
+    }
+))
+
+ALLOW_ORIGIN_HEADER = "access-control-allow-origin"
+ALLOW_METHODS_HEADER = "access-control-allow-methods"
+ALLOW_HEADERS_HEADER = "access-control-allow-headers"
+MAX_AGE_HEADER = "access-control-max-age"
+
+SSM_KEY_RESPONSE = MappingProxyType({
+    "Parameters": (
+        {
+            "Name": "key",
+            "Value": "tests"
+        },
+    )
+})
+
+SSM_KEYS_RESPONSE = MappingProxyType({
+    "Parameters": (
+        {
+            "Name": "key2",
+            "Value": "test2"
+        },
+        {
+            "Name": "key1",
+            "Value": "test1"
+        }
+    )
+})
+
+
+class FakeSSMClient:  # noqa: pylint - too-few-public-methods
+
+    def __init__(self, response=None, error=None):
+        self._response = response
+        self._error = error
+
+    def get_parameters(self, **kwargs):  # noqa: pylint - unused-argument
+        if self._error:
+            raise self._error
+        return self._response
+
+
+def make_event(path, value):
+    event = value
+    for key in reversed(path.strip("/").split("/")):
+        event = {key: event}
+    return event
+
+
+def kwargs_handler(event, context=None, **kwargs):  # noqa: pylint - unused-argument
+    return kwargs
+
+
+def empty_handler(event=None, context=None, **kwargs):  # noqa: pylint - unused-argument
+    return {}
+
+
+def non_dict_handler():
+    return "I am a string"
+
+
+def raise_key_error():
+    raise KeyError("blank")
+
+
+def handler_returning(response):
+    def handler():
+        return response
+    return handler
+
+
+class DecoratorsTestCase(unittest.TestCase):
+
+    NESTED_HELLO = MappingProxyType({
+        "a": MappingProxyType({
+            "b": MappingProxyType({
+                "c": "hello"
+            })
+        })
+    })
+
+    A_B_HELLO = MappingProxyType({
+        "a": MappingProxyType({
+            "b": "hello"
+        })
+    })
+
+    A_B_EMPTY = MappingProxyType({
+        "a": MappingProxyType({
+            "b": MappingProxyType({})
+        })
+    })
+
+    A_EMPTY = MappingProxyType({
+        "a": MappingProxyType({})
+    })
+
+    JWT_EVENT = MappingProxyType({
+        "a": MappingProxyType({
+            "b": TEST_JWT
+        })
+    })
+
+    @classmethod
+    def setUpClass(cls):
+        cls.original_logger = decorators.LOGGER
+        cls.log_spy = decorators.LOGGER = LogSpy()
+
+    @classmethod
+    def tearDownClass(cls):
+        decorators.LOGGER = cls.original_logger
+
+    def setUp(self):
+        self.log_spy.calls.clear()
+
+    def assert_error_response(self, response, status_code, body):
+        self.assertEqual(
+            {"statusCode": status_code, "body": body},
+            {"statusCode": response["statusCode"], "body": json.loads(response["body"])})
+
+
+class ExtractTests(DecoratorsTestCase):  # noqa: pylint - too-many-public-methods
 
     def test_can_get_value_from_dict_by_path(self):
         path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "hello"
-                }
-            }
-        }
-        param = Parameter(path)
-        response = param.extract_value(dictionary)
+        param = Parameter(path, "event")
+        response = param.extract_value(self.NESTED_HELLO)
         self.assertEqual("hello", response)
 
     def test_can_get_dict_value_from_dict_by_path(self):
         path = "/a/b"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "hello"
-                }
-            }
-        }
-        param = Parameter(path)
-        response = param.extract_value(dictionary)
+        param = Parameter(path, "event")
+        response = param.extract_value(make_event("/a/b/c", "hello"))
         self.assertEqual({"c": "hello"}, response)
 
+    def test_can_reuse_parameter_to_extract_from_different_dicts(self):
+        param = Parameter("/a/b/c")
+        self.assertEqual("hello", param.extract_value(self.NESTED_HELLO))
+        self.assertEqual("bye", param.extract_value(make_event("/a/b/c", "bye")))
+
     def test_raises_decode_error_convert_json_string_to_dict(self):
         path = "/a/b[json]/c"
         dictionary = {
@@ -65,11 +190,11 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
                 "c": "bye"
             }
         }
-        param = Parameter(path)
+        param = Parameter(path, "event")
         with self.assertRaises(JSONDecodeError) as context:
             param.extract_value(dictionary)
 
-        self.assertTrue("Expecting property name enclosed in double quotes" in context.exception.msg)
+        self.assertEqual("Expecting property name enclosed in double quotes", context.exception.msg)
 
     def test_can_get_value_from_dict_with_json_by_path(self):
         path = "/a/b[json]/c"
@@ -84,1040 +209,422 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
         self.assertEqual("hello", response)
 
     def test_can_get_value_from_dict_with_jwt_by_path(self):
-        path = "/a/b[jwt]/sub"
-        dictionary = {
-            "a": {
-                "b": TEST_JWT
-            }
-        }
+        for claim, expected in TEST_JWT_CLAIMS.items():
+            with self.subTest(claim=claim):
+                param = Parameter(f"/a/b[jwt]/{claim}", "event")
+                response = param.extract_value(self.JWT_EVENT)
+                self.assertEqual(expected, response)
+
+    def test_can_get_all_claims_from_dict_with_jwt_by_path(self):
+        path = "/a/b[jwt]"
         param = Parameter(path, "event")
-        response = param.extract_value(dictionary)
-        self.assertEqual("aadd1e0e-5807-4763-b1e8-5823bf631bb6", response)
+        response = param.extract_value(self.JWT_EVENT)
+        self.assertEqual(TEST_JWT_CLAIMS, response)
 
     def test_extract_from_event_calls_function_with_extra_kwargs(self):
         path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "hello"
-                }
-            }
-        }
 
-        @extract_from_event([Parameter(path)])
-        def handler(event, context, c=None):  # noqa
-            return c
+        handler = extract_from_event([Parameter(path)])(kwargs_handler)
 
-        self.assertEqual(handler(dictionary, None), "hello")
+        self.assertEqual({"c": "hello"}, handler(self.NESTED_HELLO, None))
 
     def test_extract_from_event_calls_function_with_extra_kwargs_bool_true(self):
         path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": True
-                }
-            }
-        }
+        dictionary = make_event(path, True)
 
-        @extract_from_event([Parameter(path)])
-        def handler(event, context, c=None):  # noqa
-            return c
+        handler = extract_from_event([Parameter(path)])(kwargs_handler)
 
-        self.assertFalse(handler(dictionary, None) is None)
-        self.assertEqual(True, handler(dictionary, None))
+        response = handler(dictionary, None)
+
+        self.assertIs(True, response["c"])
 
     def test_extract_from_event_calls_function_with_extra_kwargs_bool_false(self):
         path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": False
-                }
-            }
-        }
+        dictionary = make_event(path, False)
 
-        @extract_from_event([Parameter(path)])
-        def handler(event, context, c=None):  # noqa
-            return c
+        handler = extract_from_event([Parameter(path)])(kwargs_handler)
 
-        self.assertFalse(handler(dictionary, None) is None)
-        self.assertEqual(False, handler(dictionary, None))
+        response = handler(dictionary, None)
+
+        self.assertIs(False, response["c"])
 
     def test_extract_from_context_calls_function_with_extra_kwargs(self):
         path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "hello"
-                }
-            }
-        }
 
-        @extract_from_context([Parameter(path)])
-        def handler(event, context, c=None):  # noqa
-            return c
+        handler = extract_from_context([Parameter(path)])(kwargs_handler)
 
-        self.assertEqual(handler(None, dictionary), "hello")
+        self.assertEqual({"c": "hello"}, handler(None, self.NESTED_HELLO))
 
     def test_extract_returns_400_on_empty_path(self):
         path = None
-        dictionary = {
-            "a": {
-                "b": {
-                }
-            }
-        }
-
-        @extract([Parameter(path, "event")])
-        def handler(event, context, c=None):  # noqa
-            return {}
 
-        response = handler(dictionary, None)
+        handler = extract([Parameter(path, "event")])(empty_handler)
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": \"Error extracting parameters\"}", response["body"])
+        response = handler(self.A_B_EMPTY, None)
 
-    def test_extract_returns_400_on_missing_mandatory_key(self):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                }
-            }
-        }
+        self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
-        @extract([Parameter(path, "event", validators=[Mandatory])])
-        def handler(event, context, c=None):  # noqa
-            return {}
+    def test_extract_returns_400_on_path_without_keys(self):
+        for path in ("", "/"):
+            with self.subTest(path=path):
+                handler = extract([Parameter(path, "event")])(empty_handler)
 
-        response = handler(dictionary, None)
+                response = handler(self.A_B_HELLO, None)
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"c\": [\"Missing mandatory value\"]}]}", response["body"])
+                self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
     def test_can_add_name_to_parameter(self):
         path = "/a/b"
-        dictionary = {
-            "a": {
-                "b": "hello"
-            }
-        }
 
         @extract([Parameter(path, "event", validators=[Mandatory], var_name="custom")])
         def handler(event, context, custom=None):  # noqa
             return custom
 
-        response = handler(dictionary, None)
+        response = handler(self.A_B_HELLO, None)
 
         self.assertEqual("hello", response)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_can_not_add_non_pythonic_var_name_to_parameter(self, mock_logger):
+    def test_can_not_add_non_pythonic_var_name_to_parameter(self):
         path = "/a/b"
-        dictionary = {
-            "a": {
-                "b": "hello"
-            }
-        }
 
-        @extract_from_event([Parameter(path, validators=[Mandatory], var_name="with space")])
-        def handler(event, context):  # noqa
-            return {}
+        handler = extract_from_event([Parameter(path, validators=[Mandatory], var_name="with space")])(empty_handler)
 
-        response = handler(dictionary, None)
+        response = handler(self.A_B_HELLO, None)
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": \"Error extracting parameters\"}", response["body"])
+        self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
-        mock_logger.error.assert_called_once_with(
+        self.assertEqual([(
+            "error",
             "%s: %s in argument %s for path %s",
             "SyntaxError",
             "with space",
             "event",
-            "/a/b")
+            "/a/b"
+        )], self.log_spy.calls)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_can_not_add_pythonic_keyword_as_name_to_parameter(self, mock_logger):
+    def test_can_not_add_pythonic_keyword_as_name_to_parameter(self):
         path = "/a/b"
-        dictionary = {
-            "a": {
-                "b": "hello"
-            }
-        }
 
-        @extract_from_event([Parameter(path, validators=[Mandatory], var_name="class")])
-        def handler(event, context):  # noqa
-            return {}
+        handler = extract_from_event([Parameter(path, validators=[Mandatory], var_name="class")])(empty_handler)
 
-        response = handler(dictionary, None)
+        response = handler(self.A_B_HELLO, None)
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": \"Error extracting parameters\"}", response["body"])
+        self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
-        mock_logger.error.assert_called_once_with(
+        self.assertEqual([(
+            "error",
             "%s: %s in argument %s for path %s",
             "SyntaxError",
             "class",
             "event",
-            "/a/b")
+            "/a/b"
+        )], self.log_spy.calls)
 
-    def test_extract_does_not_raise_an_error_on_missing_optional_key(self):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                }
-            }
-        }
-
-        @extract([Parameter(path, "event")])
-        def handler(event, context, c=None):  # noqa
-            return {}
-
-        response = handler(dictionary, None)
+    def test_extract_returns_400_on_type_error(self):
+        path = "/a/b[json]/c"
 
-        self.assertEqual({}, response)
+        handler = extract([Parameter(path, "event")])(empty_handler)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_returns_400_on_invalid_regex_key(self, mock_logger):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "hello"
-                }
-            }
-        }
+        response = handler(self.NESTED_HELLO, None)
 
-        #  Expect a number
-        @extract([Parameter(path, "event", [RegexValidator(r"\d+")])])
-        def handler(event, context, c=None):  # noqa
-            return {}
+        self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
-        response = handler(dictionary, None)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"c\": [\"\'hello\' does not conform to regular expression \'\\\\d+\'\"]}]}",
-                         response["body"])
+    def test_extract_nulls_are_returned(self):
+        path = "/a/b"
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"c": ["'hello' does not conform to regular expression '\\d+'"]}]
-        )
+        @extract([Parameter(path, "event", default=None)], allow_none_defaults=True)
+        def handler(event, context, **kwargs):  # noqa
+            return kwargs["b"]
 
-    def test_extract_does_not_raise_an_error_on_valid_regex_key(self):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "2019"
-                }
-            }
-        }
+        response = handler(self.A_EMPTY, None)
 
-        #  Expect a number
-        @extract([Parameter(path, "event", [RegexValidator(r"\d+")])])
-        def handler(event, context, c=None):  # noqa
-            return {}
+        self.assertEqual(None, response)
 
-        response = handler(dictionary, None)
+    def test_extract_nulls_raises_exception_when_extracted_from_kwargs_if_allow_none_defaults_is_false(self):
+        path = "/a/b"
 
-        self.assertEqual({}, response)
+        @extract([Parameter(path, "event", default=None)], allow_none_defaults=False)
+        def handler(event, context, **kwargs):  # noqa
+            return kwargs["b"]
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_validate_raises_an_error_on_invalid_variables(self, mock_logger):
-        @validate([
-            ValidatedParameter(func_param_name="var1", validators=[RegexValidator(r"\d+")]),
-            ValidatedParameter(func_param_name="var2", validators=[RegexValidator(r"\d+")])
-        ])
-        def handler(var1=None, var2=None):  # noqa: pylint - unused-argument
-            return {}
+        with self.assertRaises(KeyError):
+            handler(self.A_EMPTY, None)
 
-        response = handler("2019", "abcd")
+    def test_extract_nulls_preserve_signature_defaults(self):
+        path = "/a/b"
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"var2\": [\"\'abcd\' does not conform to regular expression \'\\\\d+\'\"]}]}",
-            response["body"]
-        )
+        @extract([Parameter(path, "event")])
+        def handler(event, context, b="Hello"):  # noqa
+            return b
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"var2": ["\'abcd\' does not conform to regular expression \'\\d+\'"]}]
-        )
+        response = handler(self.A_EMPTY, None)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_validate_raises_multiple_errors_on_exit_on_error_false(self, mock_logger):
-        @validate([
-            ValidatedParameter(func_param_name="var1", validators=[RegexValidator(r"\d+")]),
-            ValidatedParameter(func_param_name="var2", validators=[RegexValidator(r"\d+")])
-        ], True)
-        def handler(var1=None, var2=None):  # noqa: pylint - unused-argument
-            return {}
+        self.assertEqual("Hello", response)
 
-        response = handler("20wq19", "abcd")
+    def test_extract_nulls_default_on_decorator_takes_precedence(self):
+        path = "/a/b"
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"var1\": [\"\'20wq19\' does not conform to regular expression \'\\\\d+\'\"]}, "
-            "{\"var2\": [\"\'abcd\' does not conform to regular expression \'\\\\d+\'\"]}]}",
-            response["body"])
+        @extract([Parameter(path, "event", default="bye")])
+        def handler(event, context, b="Hello"):  # noqa
+            return b
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [
-                {"var1": ["'20wq19' does not conform to regular expression '\\d+'"]},
-                {"var2": ["'abcd' does not conform to regular expression '\\d+'"]}
-            ]
-        )
+        response = handler(self.A_EMPTY, None)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_can_not_validate_non_pythonic_var_name(self, mock_logger):
-        @validate([
-            ValidatedParameter(func_param_name="var 1", validators=[RegexValidator(r"\d+")]),
-            ValidatedParameter(func_param_name="var2", validators=[RegexValidator(r"\d+")])
-        ], True)
-        def handler(var1=None, var2=None):  # noqa: pylint - unused-argument
-            return {}
+        self.assertEqual("bye", response)
 
-        response = handler("20wq19", "abcd")
+    def test_extract_from_event_missing_parameter_path(self):
+        event = {
+            "body": "{}"
+        }
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": \"Error extracting parameters\"}",
-            response["body"])
+        @extract_from_event(parameters=[Parameter(path="body[json]/optional/value", default="Hello")])
+        def handler(event, context, **kwargs):  # noqa
+            return {
+                "statusCode": HTTPStatus.OK,
+                "body": json.dumps(kwargs)
+            }
 
-        mock_logger.error.assert_called_once_with("%s: %s in argument %s", "KeyError", "'var 1'", "var 1")
+        expected_body = json.dumps({
+            "value": "Hello"
+        })
 
-    def test_validate_does_not_raise_an_error_on_valid_variables(self):
-        @validate([
-            ValidatedParameter(func_param_name="var1", validators=[RegexValidator(r"\d+")]),
-            ValidatedParameter(func_param_name="var2", validators=[RegexValidator(r"[ab]+")])
-        ])
-        def handler(var1, var2=None):  # noqa: pylint - unused-argument
-            return {}
+        response = handler(event, None)
 
-        response = handler("2019", var2="abba")
-        self.assertEqual({}, response)
+        self.assertEqual(HTTPStatus.OK, response["statusCode"])
+        self.assertEqual(expected_body, response["body"])
 
-    def test_extract_returns_400_on_type_error(self):
-        path = "/a/b[json]/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "hello"
-                }
-            }
+    def test_can_apply_transformation(self):
+        event = {
+            "a": "2"
         }
 
-        @extract([Parameter(path)])
-        def handler(event, context, c=None):  # noqa
-            return {}
-
-        response = handler(dictionary, None)
-
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": \"Error extracting parameters\"}", response["body"])
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_exception_handler_raises_exception(self, mock_logger):
-
-        @handle_exceptions(handlers=[ExceptionHandler(KeyError, "msg")])
-        def handler():
-            raise KeyError("blank")
-
-        response = handler()  # noqa
-
-        self.assertEqual(400, response["statusCode"])
-        self.assertTrue("msg" in response["body"])
-
-        mock_logger.error.assert_called_once_with("%s: %s", "msg", "'blank'")
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_exception_handler_raises_exception_without_friendly_message(self, mock_logger):
-
-        @handle_exceptions(handlers=[ExceptionHandler(KeyError)])
-        def handler():
-            raise KeyError("blank")
-
-        response = handler()  # noqa
-
-        self.assertEqual(400, response["statusCode"])
-        self.assertTrue("blank" in response["body"])
-
-        mock_logger.error.assert_called_once_with("'blank'")
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_exception_handler_raises_exception_with_status_code(self, mock_logger):
-
-        @handle_exceptions(handlers=[ExceptionHandler(KeyError, "error", 500)])
-        def handler():
-            raise KeyError("blank")
-
-        response = handler()  # noqa
-
-        self.assertEqual(500, response["statusCode"])
-        self.assertEqual("""{"message": "error"}""", response["body"])
-
-        mock_logger.error.assert_called_once_with("%s: %s", "error", "'blank'")
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_exception_handler_raises_exception_with_inherited_exception(self, mock_logger):
-
-        @handle_exceptions(handlers=[ExceptionHandler(Exception)])
-        def handler():
-            raise KeyError("blank")
-
-        response = handler()
-
-        self.assertEqual(400, response["statusCode"])
-        self.assertTrue("blank" in response["body"])
-
-        mock_logger.error.assert_called_once_with("'blank'")
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_log_decorator_can_log_params(self, mock_logger):  # noqa: pylint - no-self-use
-
-        @log(True, False)
-        def handler(event, context, an_other):  # noqa
-            return {}
-
-        handler("first", "{\"tests\": \"a\"}", "another")
-
-        mock_logger.info.assert_called_once_with(
-            "Function: %s, Parameters: %s", "handler", ("first", "{\"tests\": \"a\"}", "another"))
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_log_decorator_can_log_response(self, mock_logger):  # noqa: pylint - no-self-use
-
-        @log(False, True)
-        def handler():
-            return {"statusCode": 201}
-
-        handler()
-
-        mock_logger.info.assert_called_once_with("Function: %s, Response: %s", "handler", {"statusCode": 201})
-
-    @patch("boto3.client")
-    def test_get_valid_ssm_parameter(self, mock_boto_client):
-        mock_ssm = MagicMock()
-        mock_ssm.get_parameters.return_value = {
-            "Parameters": [
-                {
-                    "Name": "key",
-                    "Value": "tests"
-                }
-            ]
-        }
-        mock_boto_client.return_value = mock_ssm
-
-        @extract_from_ssm([SSMParameter("key")])
-        def handler(key=None):
-            return key
-
-        self.assertEqual(handler(), "tests")
-
-    @patch("boto3.client")
-    def test_get_valid_ssm_parameter_custom_name(self, mock_boto_client):
-        mock_ssm = MagicMock()
-        mock_ssm.get_parameters.return_value = {
-            "Parameters": [
-                {
-                    "Name": "key",
-                    "Value": "tests"
-                }
-            ]
-        }
-        mock_boto_client.return_value = mock_ssm
-
-        @extract_from_ssm([SSMParameter("key", "custom")])
-        def handler(custom=None):
-            return custom
-
-        self.assertEqual(handler(), "tests")
-
-    @patch("boto3.client")
-    def test_get_valid_ssm_parameters(self, mock_boto_client):
-        mock_ssm = MagicMock()
-        mock_ssm.get_parameters.return_value = {
-            "Parameters": [
-                {
-                    "Name": "key2",
-                    "Value": "test2"
-                },
-                {
-                    "Name": "key1",
-                    "Value": "test1"
-                }
-            ]
-        }
-        mock_boto_client.return_value = mock_ssm
-
-        @extract_from_ssm([SSMParameter("key1", "key1"), SSMParameter("key2", "key2")])
-        def handler(key1=None, key2=None):
-            return [key1, key2]
-
-        self.assertEqual(handler(), ["test1", "test2"])
-
-    @patch("boto3.client")
-    def test_get_ssm_parameter_missing_parameter_raises_client_error(self, mock_boto_client):
-        mock_ssm = MagicMock()
-        mock_ssm.get_parameters.side_effect = ClientError({}, "")
-        mock_boto_client.return_value = mock_ssm
-
-        @extract_from_ssm([SSMParameter("")])
-        def handler(key=None):
-            return key
-
-        with self.assertRaises(ClientError):
-            handler()
-
-    @patch("boto3.client")
-    def test_get_ssm_parameter_empty_key_container_raises_key_error(self, mock_boto_client):
-        mock_ssm = MagicMock()
-        mock_ssm.get_parameters.return_value = {
-        }
-        mock_boto_client.return_value = mock_ssm
-
-        @extract_from_ssm([SSMParameter("")])
-        def handler(key=None):
-            return key
-
-        with self.assertRaises(KeyError):
-            handler()
-
-    def test_body_gets_dumped_as_json(self):
-
-        @response_body_as_json
-        def handler():
-            return {"statusCode": 200, "body": {"a": "b"}}
-
-        response = handler()
-
-        self.assertEqual(response, {"statusCode": 200, "body": "{\"a\": \"b\"}"})
-
-    def test_body_dump_raises_exception_on_invalid_json(self):
-
-        @response_body_as_json
-        def handler():
-            return {"statusCode": 200, "body": {"a"}}
-
-        response = handler()
-
-        self.assertEqual(
-            response,
-            {"statusCode": 500, "body": "{\"message\": \"Response body is not JSON serializable\"}"})
-
-    def test_response_as_json_invalid_application_does_nothing(self):
-
-        @response_body_as_json
-        def handler():
-            return {"statusCode": 200}
-
-        response = handler()
-
-        self.assertEqual(response, {"statusCode": 200})
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_handle_all_exceptions(self, mock_logger):
-
-        @handle_all_exceptions()
-        def handler():
-            raise KeyError("blank")
-
-        response = handler()  # noqa
-
-        self.assertEqual(400, response["statusCode"])
-        self.assertTrue("blank" in response["body"])
-
-        mock_logger.error.assert_called_once_with("'blank'")
-
-    def test_cors_no_headers_in_response(self):
-
-        @cors(allow_origin="*", allow_methods="POST", allow_headers="Content-Type", max_age=12)
-        def handler():
-            return {}
-
-        response = handler()
-
-        self.assertEqual(response["headers"]["access-control-allow-headers"], "Content-Type")
-        self.assertEqual(response["headers"]["access-control-allow-methods"], "POST")
-        self.assertEqual(response["headers"]["access-control-allow-origin"], "*")
-        self.assertEqual(response["headers"]["access-control-max-age"], 12)
-
-    def test_cors_adds_correct_headers_only(self):
-
-        @cors(allow_origin="*")
-        def handler():
-            return {}
-
-        response = handler()
-
-        self.assertEqual(response["headers"]["access-control-allow-origin"], "*")
-        self.assertTrue("access-control-allow-methods" not in response["headers"])
-        self.assertTrue("access-control-allow-headers" not in response["headers"])
-        self.assertTrue("access-control-max-age" not in response["headers"])
-
-    def test_cors_with_headers_in_response(self):
-
-        @cors(allow_origin="*", allow_methods="POST", allow_headers="Content-Type", max_age=12)
-        def handler():
-            return {
-                "headers": {
-                    "content-type": "application/json",
-                    "access-control-allow-origin": "http://example.com"
-                }
-            }
-
-        response = handler()
-
-        self.assertEqual(response["headers"]["access-control-allow-headers"], "Content-Type")
-        self.assertEqual(response["headers"]["access-control-allow-methods"], "POST")
-        self.assertEqual(response["headers"]["access-control-allow-origin"], "http://example.com,*")
-        self.assertEqual(response["headers"]["access-control-max-age"], 12)
-
-    def test_cors_with_headers_a_none_value_does_not_remove_headers(self):
-
-        @cors(allow_origin=None)
-        def handler():
-            return {
-                "headers": {
-                    "access-control-allow-origin": "http://example.com"
-                }
-            }
-
-        response = handler()
-
-        self.assertEqual(response["headers"]["access-control-allow-origin"], "http://example.com")
-        self.assertTrue("access-control-allow-methods" not in response["headers"])
-        self.assertTrue("access-control-allow-headers" not in response["headers"])
-        self.assertTrue("access-control-max-age" not in response["headers"])
-
-    def test_cors_with_headers_an_empty_value_does_not_remove_headers(self):
-
-        @cors(allow_origin="")
-        def handler():
-            return {
-                "headers": {
-                    "access-control-allow-origin": "http://example.com"
-                }
-            }
-
-        response = handler()
-
-        self.assertEqual(response["headers"]["access-control-allow-origin"], "http://example.com")
-
-    def test_cors_with_uppercase_headers_in_response(self):
-
-        @cors(allow_origin="*", allow_methods="POST", allow_headers="Content-Type", max_age=12)
-        def handler():
-            return {
-                "Headers": {
-                    "content-type": "application/json",
-                    "Access-Control-Allow-Origin": "http://example.com"
-                }
-            }
-
-        response = handler()
-
-        self.assertEqual(response["Headers"]["access-control-allow-headers"], "Content-Type")
-        self.assertEqual(response["Headers"]["access-control-allow-methods"], "POST")
-        self.assertEqual(response["Headers"]["Access-Control-Allow-Origin"], "http://example.com,*")
-        self.assertEqual(response["Headers"]["access-control-max-age"], 12)
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_cors_invalid_max_age_logs_error(self, mock_logger):
-
-        @cors(max_age="12")
-        def handler():
-            return {}
-
-        response = handler()
-
-        self.assertEqual(response["statusCode"], 500)
-        self.assertEqual(response["body"], "{\"message\": \"Invalid value type in CORS header\"}")
-
-        mock_logger.error.assert_called_once_with("Cannot set %s header to a non %s value",
-                                                  "access-control-max-age",
-                                                  int)
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_cors_cannot_decorate_non_dict(self, mock_logger):
-
-        @cors(allow_origin="*")
-        def handler():
-            return "I am a string"
-
-        response = handler()
-
-        self.assertEqual(response["statusCode"], 500)  # noqa: pylint-invalid-sequence-index
-        self.assertEqual(response["body"], "{\"message\": \"Invalid response type for CORS headers\"}")  # noqa: pylint-invalid-sequence-index
-
-        mock_logger.error.assert_called_once_with("Cannot add headers to a non dictionary response")
-
-    def test_extract_returns_400_on_invalid_dictionary_schema(self):
-        path = "/a"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": 3
-                }
-            }
-        }
-
-        schema = Schema(
-            {
-                "b": And(dict, {
-                    "c": str
-                })
-            }
-        )
-
-        @extract([Parameter(path, "event", validators=[SchemaValidator(schema)])])
-        def handler(event, context, c=None):  # noqa
-            return {}
-
-        response = handler(dictionary, None)
-
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"a\": [\"\'{\'b\': {\'c\': 3}}\' "
-            "does not validate against schema "
-            "\'Schema({\'b\': And(<class \'dict\'>, {\'c\': <class \'str\'>})})\'\"]}]}",
-            response["body"])
-
-    def test_extract_valid_dictionary_schema(self):
-        path = "/a"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "d"
-                }
-            }
-        }
-
-        schema = Schema(
-            {
-                "b": And(dict, {
-                    "c": str
-                }),
-                Optional("j"): str
-            }
-        )
-
-        @extract([Parameter(path, "event", validators=[SchemaValidator(schema)])])
-        def handler(event, context, a=None):  # noqa
+        @extract([Parameter("/a", "event", transform=float)])
+        def handler(event, a=None):  # noqa: pylint - unused-argument
             return a
 
-        response = handler(dictionary, None)
-
-        expected = {
-            "b": {
-                "c": "d"
-            }
-        }
-        self.assertEqual(expected, response)
-
-    def test_extract_schema_when_property_is_none(self):
-        path = "/a/b"
-        dictionary = {
-            "a": {}
-        }
-
-        schema = Schema(
-            {
-                "b": And(dict, {
-                    "c": str
-                }),
-                Optional("j"): str
-            }
-        )
-
-        @extract([Parameter(path, "event", validators=[SchemaValidator(schema)])])
-        def handler(event, context, b=None):  # noqa
-            return b
-
-        response = handler(dictionary, None)
-
-        self.assertEqual(None, response)
-
-    def test_extract_parameter_with_minimum(self):
-        event = {
-            "value": 20
-        }
-
-        @extract([Parameter("/value", "event", validators=[Minimum(10.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
         response = handler(event)
-        self.assertEqual({}, response)
-
-    def test_error_extracting_parameter_with_minimum(self):
-        event = {
-            "value": 5
-        }
-
-        @extract([Parameter("/value", "event", validators=[Minimum(10.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual(response["statusCode"], 400)
-        self.assertEqual(
-            "{\"message\": [{\"value\": [\"\'5\' is less than minimum value \'10.0\'\"]}]}",
-            response["body"])
-
-    def test_error_extracting_non_numeric_parameter_with_minimum(self):
-        event = {
-            "value": "20"
-        }
-
-        @extract([Parameter("/value", "event", validators=[Minimum(10.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual(response["statusCode"], 400)
-        self.assertEqual(
-            "{\"message\": [{\"value\": [\"\'20\' is less than minimum value \'10.0\'\"]}]}", response["body"])
-
-    def test_extract_optional_null_parameter_with_minimum(self):
-        event = {
-        }
-
-        @extract([Parameter("/value", "event", validators=[Minimum(10.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual({}, response)
-
-    def test_extract_mandatory_parameter_with_minimum(self):
-        event = {
-            "value": 20
-        }
-
-        @extract([Parameter("/value", "event", validators=[Minimum(10.0), Mandatory])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual({}, response)
+        self.assertEqual(2, response)
 
-    def test_extract_parameter_with_maximum(self):
+    def test_apply_transformation_on_none_value(self):
         event = {
-            "value": 20
+            "a": None
         }
 
-        @extract([Parameter("/value", "event", validators=[Maximum(100.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        @extract([Parameter("/a", "event", transform=float)])
+        def handler(event, a=None):  # noqa: pylint - unused-argument
+            return a
 
         response = handler(event)
-        self.assertEqual({}, response)
+        self.assertEqual(None, response)
 
-    def test_error_extracting_parameter_with_maximum(self):
+    def test_apply_custom_transformation(self):
         event = {
-            "value": 105
+            "a": "2"
         }
 
-        @extract([Parameter("/value", "event", validators=[Maximum(100.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual(response["statusCode"], 400)
-        self.assertEqual(
-            "{\"message\": [{\"value\": [\"\'105\' is greater than maximum value \'100.0\'\"]}]}", response["body"])
-
-    def test_error_extracting_non_numeric_parameter_with_maximum(self):
-        event = {
-            "value": "20"
-        }
+        def to_float(arg):
+            return float(arg)
 
-        @extract([Parameter("/value", "event", validators=[Maximum(100.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        @extract([Parameter("/a", "event", transform=to_float)])
+        def handler(event, a=None):  # noqa: pylint - unused-argument
+            return a
 
         response = handler(event)
-        self.assertEqual(response["statusCode"], 400)
-        self.assertEqual(
-            "{\"message\": [{\"value\": [\"\'20\' is greater than maximum value \'100.0\'\"]}]}", response["body"])
+        self.assertEqual(2, response)
 
-    def test_extract_optional_null_parameter_with_maximum(self):
+    def test_apply_custom_transformation_with_error_handling(self):
         event = {
+            "a": "abc"
         }
 
-        @extract([Parameter("/value", "event", validators=[Maximum(10.0)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual({}, response)
+        def to_float(arg):
+            try:
+                return float(arg)
+            except Exception:
+                raise Exception(f"Custom error message: value '{arg}' cannot be converted to float")
 
-    def test_extract_mandatory_parameter_with_maximum(self):
-        event = {
-            "value": 20
-        }
-
-        @extract([Parameter("/value", "event", validators=[Maximum(100.0), Mandatory])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        handler = extract([Parameter("/a", "event", transform=to_float)])(empty_handler)
 
         response = handler(event)
-        self.assertEqual({}, response)
+        self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
-    def test_extract_mandatory_parameter_with_range(self):
-        event = {
-            "value": 20
-        }
-
-        @extract([Parameter("/value", "event", validators=[Minimum(10.0), Maximum(100.0), Mandatory])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual({}, response)
+        self.assertEqual([(
+            "error",
+            "%s: %s in argument %s for path %s",
+            "Exception",
+            "Custom error message: value 'abc' cannot be converted to float",
+            "event",
+            "/a"
+        )], self.log_spy.calls)
 
-    def test_extract_parameter_with_maximum_length(self):
+    def test_apply_invalid_transformation_raises_error(self):
         event = {
-            "value": "correct"
+            "a": "abc"
         }
 
-        @extract([Parameter("/value", "event", validators=[MaxLength(20)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        handler = extract([Parameter("/a", "event", transform=float)])(empty_handler)
 
         response = handler(event)
-        self.assertEqual({}, response)
+        self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
-    def test_error_extracting_parameter_with_max_length(self):
-        event = {
-            "value": "too long"
-        }
+        self.assertEqual([(
+            "error",
+            "%s: %s in argument %s for path %s",
+            "ValueError",
+            "could not convert string to float: 'abc'",
+            "event",
+            "/a"
+        )], self.log_spy.calls)
+
+
+class ValidatorsTests(DecoratorsTestCase):  # noqa: pylint - too-many-public-methods
+
+    def test_extract_returns_400_on_invalid_value(self):
+        date_format = "%Y-%m-%d %H:%M:%S"
+        cases = (
+            ("/a/b/c", self.A_B_EMPTY, [Mandatory], [{"c": ["Missing mandatory value"]}]),
+            ("/a/b/c", self.NESTED_HELLO, [DIGITS_REGEX],
+             [{"c": ["'hello' does not conform to regular expression '\\d+'"]}]),
+            ("/a/b/c", make_event("/a/b/c", 1), [Type(bool)], [{"c": ["'1' is not of type 'bool'"]}]),
+            ("/a/b/c", make_event("/a/b/c", 1), [Type(float)], [{"c": ["'1' is not of type 'float'"]}]),
+            ("/a/b/c", make_event("/a/b/c", "Hello"), [EnumValidator("bye", "test", "another")],
+             [{"c": ["'Hello' is not in list '('bye', 'test', 'another')'"]}]),
+            ("/a", make_event("/a/b/c", 3), [SchemaValidator(DICT_B_SCHEMA)],
+             [{"a": [
+                 "'{'b': {'c': 3}}' does not validate against schema "
+                 "'Schema({'b': And(<class 'dict'>, {'c': <class 'str'>})})'"
+             ]}]),
+            ("/a", {"a": {}}, [NonEmpty], [{"a": ["Value is empty"]}]),
+            ("/a", {"a": {}}, [NonEmpty("The value was empty")], [{"a": ["The value was empty"]}]),
+            ("/a", {"a": "2001-01-01 35:00:00"}, [DateValidator(date_format)],
+             [{"a": ["'2001-01-01 35:00:00' is not a '%Y-%m-%d %H:%M:%S' date"]}]),
+            ("/a", {"a": "2001-01-01 35:00:00"}, [DateValidator(date_format, "Not a valid date!")],
+             [{"a": ["Not a valid date!"]}]),
+            ("/a", {"a": "GBT"}, [CurrencyValidator], [{"a": ["'GBT' is not a valid currency code."]}]),
+        )
 
-        @extract([Parameter("/value", "event", validators=[MaxLength(5)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        for path, event, validators, errors in cases:
+            with self.subTest(path=path, validators=validators):
+                self.log_spy.calls.clear()
 
-        response = handler(event)
-        self.assertEqual(response["statusCode"], 400)
-        self.assertEqual(
-            "{\"message\": [{\"value\": [\"\'too long\' is longer than maximum length \'5\'\"]}]}",
-            response["body"])
+                response = extract([Parameter(path, "event", validators)])(empty_handler)(event, None)
 
-    def test_values_are_stringified_in_max_length_validator(self):
-        event = {
-            "value": 20
-        }
+                self.assert_error_response(response, 400, {"message": errors})
 
-        @extract([Parameter("/value", "event", validators=[MaxLength(5)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+                self.assertEqual([("error", "Error validating parameters. Errors: %s", errors)], self.log_spy.calls)
 
-        response = handler(event)
-        self.assertEqual({}, response)
+    def test_extract_does_not_raise_an_error_on_missing_optional_key(self):
+        path = "/a/b/c"
 
-    def test_extract_optional_null_parameter_with_max_length(self):
-        event = {
-        }
+        handler = extract([Parameter(path, "event")])(empty_handler)
 
-        @extract([Parameter("/value", "event", validators=[MaxLength(5)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        response = handler(self.A_B_EMPTY, None)
 
-        response = handler(event)
         self.assertEqual({}, response)
 
-    def test_extract_mandatory_parameter_with_max_length(self):
-        event = {
-            "value": "aa"
-        }
-
-        @extract([Parameter("/value", "event", validators=[MaxLength(5), Mandatory])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual({}, response)
+    def test_extract_does_not_raise_an_error_on_valid_regex_key(self):
+        path = "/a/b/c"
+        dictionary = make_event(path, "2019")
 
-    def test_extract_parameter_with_mainimum_length(self):
-        event = {
-            "value": "correct"
-        }
+        #  Expect a number
+        handler = extract([Parameter(path, "event", [DIGITS_REGEX])])(empty_handler)
 
-        @extract([Parameter("/value", "event", validators=[MinLength(4)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        response = handler(dictionary, None)
 
-        response = handler(event)
         self.assertEqual({}, response)
 
-    def test_error_extracting_parameter_with_min_length(self):
-        event = {
-            "value": "too short"
-        }
-
-        @extract([Parameter("/value", "event", validators=[MinLength(15)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
-
-        response = handler(event)
-        self.assertEqual(response["statusCode"], 400)
-        self.assertEqual(
-            "{\"message\": [{\"value\": [\"\'too short\' is shorter than minimum length \'15\'\"]}]}",
-            response["body"])
-
-    def test_values_are_stringified_in_min_length_validator(self):
-        event = {
-            "value": 20
-        }
-
-        @extract([Parameter("/value", "event", validators=[MinLength(1)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+    def test_extract_valid_dictionary_schema(self):
+        path = "/a"
+        dictionary = make_event("/a/b/c", "d")
 
-        response = handler(event)
-        self.assertEqual({}, response)
+        handler = extract([Parameter(path, "event", [OPTIONAL_J_SCHEMA_VALIDATOR])])(kwargs_handler)
 
-    def test_extract_optional_null_parameter_with_min_length(self):
-        event = {
-        }
+        response = handler(dictionary, None)
 
-        @extract([Parameter("/value", "event", validators=[MinLength(5)])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        expected = {
+            "b": {
+                "c": "d"
+            }
+        }
+        self.assertEqual({"a": expected}, response)
 
-        response = handler(event)
-        self.assertEqual({}, response)
+    def test_extract_schema_when_property_is_none(self):
+        path = "/a/b"
 
-    def test_extract_mandatory_parameter_with_min_length(self):
-        event = {
-            "value": "aa"
-        }
+        handler = extract([Parameter(path, "event", [OPTIONAL_J_SCHEMA_VALIDATOR])])(kwargs_handler)
 
-        @extract([Parameter("/value", "event", validators=[MaxLength(2), Mandatory])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+        response = handler(self.A_EMPTY, None)
 
-        response = handler(event)
         self.assertEqual({}, response)
 
-    def test_extract_mandatory_parameter_with_length_range(self):
-        event = {
-            "value": "right in the middle"
-        }
+    def assert_extract_value_cases(self, cases):
+        for event, validators, expected in cases:
+            with self.subTest(event=event, validators=validators):
+                response = extract([Parameter("/value", "event", validators=validators)])(empty_handler)(event)
+                if expected is None:
+                    self.assertEqual({}, response)
+                else:
+                    self.assert_error_response(response, *expected)
 
-        @extract([Parameter("/value", "event", validators=[MinLength(10), MaxLength(100), Mandatory])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return {}
+    def test_extract_parameter_with_minimum(self):
+        cases = [
+            ({"value": 20}, [MINIMUM_10], None),
+            ({"value": 5}, [MINIMUM_10], (400, {
+                "message": [{"value": ["'5' is less than minimum value '10.0'"]}]
+            })),
+            ({"value": "20"}, [MINIMUM_10], (400, {
+                "message": [{"value": ["'20' is less than minimum value '10.0'"]}]
+            })),
+            ({}, [MINIMUM_10], None),
+            ({"value": 20}, [MINIMUM_10, Mandatory], None)
+        ]
+
+        self.assert_extract_value_cases(cases)
 
-        response = handler(event)
-        self.assertEqual({}, response)
+    def test_extract_parameter_with_maximum(self):
+        cases = [
+            ({"value": 20}, [MAXIMUM_100], None),
+            ({"value": 105}, [MAXIMUM_100], (400, {
+                "message": [{"value": ["'105' is greater than maximum value '100.0'"]}]
+            })),
+            ({"value": "20"}, [MAXIMUM_100], (400, {
+                "message": [{"value": ["'20' is greater than maximum value '100.0'"]}]
+            })),
+            ({}, [Maximum(10.0)], None),
+            ({"value": 20}, [MAXIMUM_100, Mandatory], None),
+            ({"value": 20}, [MINIMUM_10, MAXIMUM_100, Mandatory], None)
+        ]
+
+        self.assert_extract_value_cases(cases)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_exit_on_error_false_bundles_all_errors(self, mock_logger):
+    def test_extract_parameter_with_maximum_length(self):
+        cases = [
+            ({"value": "correct"}, [MaxLength(20)], None),
+            ({"value": "too long"}, [MaxLength(5)], (400, {
+                "message": [{"value": ["'too long' is longer than maximum length '5'"]}]
+            })),
+            ({"value": 20}, [MaxLength(5)], None),  # values are stringified
+            ({}, [MaxLength(5)], None),
+            ({"value": "aa"}, [MaxLength(5), Mandatory], None)
+        ]
+
+        self.assert_extract_value_cases(cases)
+
+    def test_extract_parameter_with_minimum_length(self):
+        cases = [
+            ({"value": "correct"}, [MinLength(4)], None),
+            ({"value": "too short"}, [MinLength(15)], (400, {
+                "message": [{"value": ["'too short' is shorter than minimum length '15'"]}]
+            })),
+            ({"value": 20}, [MinLength(1)], None),  # values are stringified
+            ({}, [MinLength(5)], None),
+            ({"value": "aa"}, [MinLength(2), Mandatory], None),
+            ({"value": "right in the middle"}, [MinLength(10), MaxLength(100), Mandatory], None)
+        ]
+
+        self.assert_extract_value_cases(cases)
+
+    def test_exit_on_error_false_bundles_all_errors(self):
         path_1 = "/a/b/c"
         path_2 = "/a/b/d"
         path_3 = "/a/b/e"
@@ -1133,44 +640,39 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
             }
         }
 
-        schema = Schema(
-            {
-                "g": int
-            }
-        )
-
-        @extract([
+        handler = extract([
             Parameter(path_1, "event", validators=[Mandatory], var_name="c"),
             Parameter(path_2, "event", validators=[Mandatory]),
             Parameter(path_3, "event", validators=[Minimum(30)]),
             Parameter(path_4, "event", validators=[Maximum(10)]),
             Parameter(path_5, "event", validators=[
-                RegexValidator(r"[0-9]+"),
+                NUMBER_REGEX,
                 RegexValidator(r"[1][0-9]+"),
-                SchemaValidator(schema),
+                SchemaValidator(INT_G_SCHEMA),
                 MinLength(2),
                 MaxLength(0)
             ])
-        ], True)
-        def handler(event, context, c=None, d=None):  # noqa: pylint - unused-argument
-            return {}
+        ], True)(empty_handler)
 
         response = handler(dictionary, None)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"c\": [\"Missing mandatory value\"]}, "
-            "{\"d\": [\"Missing mandatory value\"]}, "
-            "{\"e\": [\"\'23\' is less than minimum value \'30\'\"]}, "
-            "{\"f\": [\"\'15\' is greater than maximum value \'10\'\"]}, "
-            "{\"g\": [\"\'a\' does not conform to regular expression \'[0-9]+\'\", "
-            "\"\'a\' does not conform to regular expression \'[1][0-9]+\'\", "
-            "\"\'a\' does not validate against schema \'Schema({\'g\': <class \'int\'>})\'\", "
-            "\"\'a\' is shorter than minimum length \'2\'\", "
-            "\"\'a\' is longer than maximum length \'0\'\""
-            "]}]}",
-            response["body"])
-
-        mock_logger.error.assert_called_once_with(
+        self.assert_error_response(
+            response, 400,
+            {"message": [
+                {"c": ["Missing mandatory value"]},
+                {"d": ["Missing mandatory value"]},
+                {"e": ["'23' is less than minimum value '30'"]},
+                {"f": ["'15' is greater than maximum value '10'"]},
+                {"g": [
+                    "'a' does not conform to regular expression '[0-9]+'",
+                    "'a' does not conform to regular expression '[1][0-9]+'",
+                    "'a' does not validate against schema 'Schema({'g': <class 'int'>})'",
+                    "'a' is shorter than minimum length '2'",
+                    "'a' is longer than maximum length '0'"
+                ]}
+            ]})
+
+        self.assertEqual([(
+            "error",
             "Error validating parameters. Errors: %s",
             [
                 {"c": ["Missing mandatory value"]},
@@ -1185,21 +687,16 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
                     "'a' is longer than maximum length '0'"
                 ]}
             ]
-        )
+        )], self.log_spy.calls)
 
     def test_group_errors_true_returns_ok(self):
         path = "/a/b"
-        dictionary = {
-            "a": {
-                "b": "hello"
-            }
-        }
 
         @extract([Parameter(path, "event", validators=[Mandatory])], True)
         def handler(event, context, b=None):  # noqa
             return b
 
-        response = handler(dictionary, None)
+        response = handler(self.A_B_HELLO, None)
 
         self.assertEqual("hello", response)
 
@@ -1208,51 +705,37 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
             "var": ""
         }
 
-        @extract([
+        handler = extract([
             Parameter("/var", "event", validators=[Mandatory], default="hello")
-        ])
-        def handler(event, context, var=None):  # noqa: pylint - unused-argument
-            return {}
+        ])(empty_handler)
 
         response = handler(event, None)
 
-        self.assertEqual(response["statusCode"], 400)
-        self.assertEqual("{\"message\": [{\"var\": [\"Missing mandatory value\"]}]}", response["body"])
+        self.assert_error_response(response, 400, {"message": [{"var": ["Missing mandatory value"]}]})
 
     def test_group_errors_true_on_extract_from_event_returns_ok(self):
         path = "/a/b"
-        dictionary = {
-            "a": {
-                "b": "hello"
-            }
-        }
 
         @extract_from_event([Parameter(path, validators=[Mandatory])], True)
         def handler(event, context, b=None):  # noqa
             return b
 
-        response = handler(dictionary, None)
+        response = handler(self.A_B_HELLO, None)
 
         self.assertEqual("hello", response)
 
     def test_group_errors_true_on_extract_from_context_returns_ok(self):
         path = "/a/b"
-        dictionary = {
-            "a": {
-                "b": "hello"
-            }
-        }
 
         @extract_from_context([Parameter(path, validators=[Mandatory])], True)
         def handler(event, context, b=None):  # noqa
             return b
 
-        response = handler(None, dictionary)
+        response = handler(None, self.A_B_HELLO)
 
         self.assertEqual("hello", response)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_can_output_custom_error_message_on_validation_failure(self, mock_logger):
+    def test_can_output_custom_error_message_on_validation_failure(self):
         path_1 = "/a/b/c"
         path_2 = "/a/b/d"
         path_3 = "/a/b/e"
@@ -1268,13 +751,7 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
             }
         }
 
-        schema = Schema(
-            {
-                "g": int
-            }
-        )
-
-        @extract([
+        handler = extract([
             Parameter(path_1, "event", validators=[Mandatory("Missing c")], var_name="c"),
             Parameter(path_2, "event", validators=[Mandatory("Missing d")]),
             Parameter(path_3, "event", validators=[Minimum(30, "Bad e value {value}, should be at least {condition}")]),
@@ -1282,31 +759,26 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
             Parameter(path_5, "event", validators=[
                 RegexValidator(r"[0-9]+", "Bad g regex 1"),
                 RegexValidator(r"[1][0-9]+", "Bad g regex 2"),
-                SchemaValidator(schema, "Bad g schema"),
+                SchemaValidator(INT_G_SCHEMA, "Bad g schema"),
                 MinLength(2, "Bad g min length"),
                 MaxLength(0, "Bad g max length")
             ])
-        ], True)
-        def handler(event, context, c=None, d=None):  # noqa: pylint - unused-argument
-            return {}
+        ], True)(empty_handler)
 
         response = handler(dictionary, None)
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"c\": [\"Missing c\"]}, "
-            "{\"d\": [\"Missing d\"]}, "
-            "{\"e\": [\"Bad e value 23, should be at least 30\"]}, "
-            "{\"f\": [\"Bad f\"]}, "
-            "{\"g\": [\"Bad g regex 1\", "
-            "\"Bad g regex 2\", "
-            "\"Bad g schema\", "
-            "\"Bad g min length\", "
-            "\"Bad g max length\""
-            "]}]}",
-            response["body"])
-
-        mock_logger.error.assert_called_once_with(
+        self.assert_error_response(
+            response, 400,
+            {"message": [
+                {"c": ["Missing c"]},
+                {"d": ["Missing d"]},
+                {"e": ["Bad e value 23, should be at least 30"]},
+                {"f": ["Bad f"]},
+                {"g": ["Bad g regex 1", "Bad g regex 2", "Bad g schema", "Bad g min length", "Bad g max length"]}
+            ]})
+
+        self.assertEqual([(
+            "error",
             "Error validating parameters. Errors: %s",
             [
                 {"c": ["Missing c"]},
@@ -1321,520 +793,398 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
                     "Bad g max length"
                 ]}
             ]
-        )
+        )], self.log_spy.calls)
 
     def test_extract_returns_400_on_missing_mandatory_key_with_regex(self):
         path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                }
-            }
-        }
 
-        @extract([Parameter(path, "event", validators=[Mandatory, RegexValidator("[0-9]+")])], group_errors=True)
-        def handler(event, context, c=None):  # noqa
-            return {}
+        handler = extract([Parameter(path, "event", validators=[Mandatory, NUMBER_REGEX])],
+                          group_errors=True)(empty_handler)
 
-        response = handler(dictionary, None)
+        response = handler(self.A_B_EMPTY, None)
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"c\": [\"Missing mandatory value\"]}]}", response["body"])
+        self.assert_error_response(response, 400, {"message": [{"c": ["Missing mandatory value"]}]})
 
-    def test_extract_nulls_are_returned(self):
-        path = "/a/b"
-        dictionary = {
-            "a": {
-            }
-        }
+    def test_type_validator_returns_true_when_none_is_passed_in(self):
+        path = "/a/b/c"
+        dictionary = make_event(path, None)
 
-        @extract([Parameter(path, "event", default=None)], allow_none_defaults=True)
-        def handler(event, context, **kwargs):  # noqa
-            return kwargs["b"]
+        handler = extract([Parameter(path, "event", [Type(float)])])(kwargs_handler)
 
         response = handler(dictionary, None)
+        self.assertEqual({}, response)
 
-        self.assertEqual(None, response)
-
-    def test_extract_nulls_raises_exception_when_extracted_from_kwargs_if_allow_none_defaults_is_false(self):
-        path = "/a/b"
-        dictionary = {
-            "a": {
-            }
-        }
+    def test_extract_succeeds_with_valid_type_validation(self):
+        path = "/a/b/c"
+        dictionary = make_event(path, 1)
 
-        @extract([Parameter(path, "event", default=None)], allow_none_defaults=False)
-        def handler(event, context, **kwargs):  # noqa
-            return kwargs["b"]
+        handler = extract([Parameter(path, "event", [Type(int)])])(kwargs_handler)
 
-        with self.assertRaises(KeyError):
-            handler(dictionary, None)
+        response = handler(dictionary, None)
+        self.assertEqual({"c": 1}, response)
 
-    def test_extract_nulls_preserve_signature_defaults(self):
-        path = "/a/b"
-        dictionary = {
-            "a": {
-            }
-        }
+    def test_extract_suceeds_with_valid_enum_validation(self):
+        path = "/a/b/c"
+        dictionary = make_event(path, 123)
 
-        @extract([Parameter(path, "event")])
-        def handler(event, context, b="Hello"):  # noqa
-            return b
+        handler = extract([Parameter(path, "event", [EnumValidator("Hello", 123)])])(kwargs_handler)
 
         response = handler(dictionary, None)
+        self.assertEqual({"c": 123}, response)
 
-        self.assertEqual("Hello", response)
+    def test_enum_validator_handles_unhashable_values(self):
+        self.assertTrue(EnumValidator([1], [2]).validate([2]))
+        self.assertFalse(EnumValidator("Hello", 123).validate({"a": "Hello"}))
 
-    def test_extract_nulls_default_on_decorator_takes_precedence(self):
-        path = "/a/b"
-        dictionary = {
-            "a": {
-            }
-        }
+    def test_enum_validator_returns_true_when_none_is_passed_in(self):
+        path = "/a/b/c"
+        dictionary = make_event(path, None)
 
-        @extract([Parameter(path, "event", default="bye")])
-        def handler(event, context, b="Hello"):  # noqa
-            return b
+        handler = extract([Parameter(path, "event", [EnumValidator("Test", "another")])])(kwargs_handler)
 
         response = handler(dictionary, None)
+        self.assertEqual({}, response)
 
-        self.assertEqual("bye", response)
-
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_returns_400_on_invalid_bool_type(self, mock_logger):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": 1
-                }
-            }
+    def test_extract_non_empty_parameter(self):
+        event = {
+            "value": 20
         }
 
-        @extract([Parameter(path, "event", [Type(bool)])])
-        def handler(event, context, c=None):  # noqa
-            return {}
+        handler = extract([Parameter("/value", "event", [NonEmpty])])(kwargs_handler)
 
-        response = handler(dictionary, None)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"c\": [\"\'1\' is not of type \'bool'\"]}]}", response["body"])
+        response = handler(event)
+        self.assertEqual({"value": 20}, response)
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"c": ["'1' is not of type 'bool'"]}]
-        )
+    def test_extract_missing_non_empty_parameter(self):
+        event = {
+            "a": 20
+        }
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_returns_400_on_invalid_float_type(self, mock_logger):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": 1
-                }
-            }
+        handler = extract([Parameter("/b", "event", [NonEmpty])])(kwargs_handler)
+
+        response = handler(event)
+        self.assertEqual({}, response)
+
+    def test_extract_date_parameter(self):
+        event = {
+            "a": "2001-01-01 00:00:00"
         }
 
-        @extract([Parameter(path, "event", [Type(float)])])
-        def handler(event, context, c=None):  # noqa
-            return {}
+        handler = extract([Parameter("/a", "event", [DateValidator("%Y-%m-%d %H:%M:%S")])])(kwargs_handler)
 
-        response = handler(dictionary, None)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"c\": [\"\'1\' is not of type \'float'\"]}]}", response["body"])
+        response = handler(event)
+        self.assertEqual({"a": "2001-01-01 00:00:00"}, response)
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"c": ["'1' is not of type 'float'"]}]
-        )
+    def test_extract_date_parameter_valid_on_empty(self):
+        event = {
+            "a": None
+        }
 
-    def test_type_validator_returns_true_when_none_is_passed_in(self):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": None
-                }
-            }
+        handler = extract([Parameter("/a", "event", [DateValidator("%Y-%m-%d %H:%M:%S")])])(kwargs_handler)
+
+        response = handler(event)
+        self.assertEqual({}, response)
+
+    def test_extract_currency_parameter(self):
+        event = {
+            "a": "GBP"
         }
 
-        @extract([Parameter(path, "event", [Type(float)])])
-        def handler(event, context, c=None):  # noqa
-            return c
+        handler = extract([Parameter("/a", "event", [CurrencyValidator])])(kwargs_handler)
 
-        response = handler(dictionary, None)
-        self.assertEqual(None, response)
+        response = handler(event)
+        self.assertEqual({"a": "GBP"}, response)
 
-    def test_extract_succeeds_with_valid_type_validation(self):
+    def test_currency_validator_returns_true_when_none_is_passed_in(self):
         path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": 1
-                }
-            }
-        }
+        dictionary = make_event(path, None)
 
-        @extract([Parameter(path, "event", [Type(int)])])
-        def handler(event, context, c=None):  # noqa
-            return c
+        handler = extract([Parameter(path, "event", [CurrencyValidator])])(kwargs_handler)
 
         response = handler(dictionary, None)
-        self.assertEqual(1, response)
+        self.assertEqual({}, response)
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_returns_400_on_value_not_in_list(self, mock_logger):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": "Hello"
-                }
-            }
+    def test_currency_validator_can_be_called_non_statically(self):
+        event = {
+            "a": "GBP"
         }
 
-        @extract([Parameter(path, "event", [EnumValidator("bye", "test", "another")])])
-        def handler(event, context, c=None):  # noqa
-            return {}
+        handler = extract([Parameter("/a", "event", [CurrencyValidator()])])(kwargs_handler)
 
-        response = handler(dictionary, None)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"c\": [\"\'Hello\' is not in list \'(\'bye\', \'test\', \'another\')'\"]}]}",
-            response["body"])
+        response = handler(event)
+        self.assertEqual({"a": "GBP"}, response)
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"c": ["'Hello' is not in list '('bye', 'test', 'another')'"]}]
-        )
 
-    def test_extract_suceeds_with_valid_enum_validation(self):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": 123
-                }
-            }
-        }
+class ValidateTests(DecoratorsTestCase):
 
-        @extract([Parameter(path, "event", [EnumValidator("Hello", 123)])])
-        def handler(event, context, c=None):  # noqa
-            return c
+    def test_validate_raises_an_error_on_invalid_variables(self):
+        @validate([
+            ValidatedParameter(func_param_name="var1", validators=[DIGITS_REGEX]),
+            ValidatedParameter(func_param_name="var2", validators=[DIGITS_REGEX])
+        ])
+        def handler(var1=None, var2=None):  # noqa: pylint - unused-argument
+            return {}
 
-        response = handler(dictionary, None)
-        self.assertEqual(123, response)
+        response = handler("2019", "abcd")
 
-    def test_enum_validator_returns_true_when_none_is_passed_in(self):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": None
-                }
-            }
-        }
+        self.assert_error_response(
+            response, 400,
+            {"message": [{"var2": ["'abcd' does not conform to regular expression '\\d+'"]}]})
 
-        @extract([Parameter(path, "event", [EnumValidator("Test", "another")])])
-        def handler(event, context, c=None):  # noqa
-            return c
+        self.assertEqual([(
+            "error",
+            "Error validating parameters. Errors: %s",
+            [{"var2": ["\'abcd\' does not conform to regular expression \'\\d+\'"]}]
+        )], self.log_spy.calls)
 
-        response = handler(dictionary, None)
-        self.assertEqual(None, response)
+    def test_validate_raises_multiple_errors_on_exit_on_error_false(self):
+        @validate([
+            ValidatedParameter(func_param_name="var1", validators=[DIGITS_REGEX]),
+            ValidatedParameter(func_param_name="var2", validators=[DIGITS_REGEX])
+        ], True)
+        def handler(var1=None, var2=None):  # noqa: pylint - unused-argument
+            return {}
 
-    def test_extract_from_event_missing_parameter_path(self):
-        event = {
-            "body": "{}"
-        }
+        response = handler("20wq19", "abcd")
 
-        @extract_from_event(parameters=[Parameter(path="body[json]/optional/value", default="Hello")])
-        def handler(event, context, **kwargs):  # noqa
-            return {
-                "statusCode": HTTPStatus.OK,
-                "body": json.dumps(kwargs)
-            }
+        self.assert_error_response(
+            response, 400,
+            {"message": [
+                {"var1": ["'20wq19' does not conform to regular expression '\\d+'"]},
+                {"var2": ["'abcd' does not conform to regular expression '\\d+'"]}
+            ]})
+
+        self.assertEqual([(
+            "error",
+            "Error validating parameters. Errors: %s",
+            [
+                {"var1": ["'20wq19' does not conform to regular expression '\\d+'"]},
+                {"var2": ["'abcd' does not conform to regular expression '\\d+'"]}
+            ]
+        )], self.log_spy.calls)
 
-        expected_body = json.dumps({
-            "value": "Hello"
-        })
+    def test_can_not_validate_non_pythonic_var_name(self):
+        @validate([
+            ValidatedParameter(func_param_name="var 1", validators=[DIGITS_REGEX]),
+            ValidatedParameter(func_param_name="var2", validators=[DIGITS_REGEX])
+        ], True)
+        def handler(var1=None, var2=None):  # noqa: pylint - unused-argument
+            return {}
 
-        response = handler(event, None)
+        response = handler("20wq19", "abcd")
 
-        self.assertEqual(HTTPStatus.OK, response["statusCode"])
-        self.assertEqual(expected_body, response["body"])
+        self.assert_error_response(response, 400, EXTRACT_ERROR_BODY)
 
-    def test_extract_non_empty_parameter(self):
-        event = {
-            "value": 20
-        }
+        self.assertEqual([("error", "%s: %s in argument %s", "KeyError", "'var 1'", "var 1")], self.log_spy.calls)
 
-        @extract([Parameter("/value", "event", validators=[NonEmpty])])
-        def handler(event, value=None):  # noqa: pylint - unused-argument
-            return value
+    def test_validate_does_not_raise_an_error_on_valid_variables(self):
+        @validate([
+            ValidatedParameter(func_param_name="var1", validators=[DIGITS_REGEX]),
+            ValidatedParameter(func_param_name="var2", validators=[AB_REGEX])
+        ])
+        def handler(var1, var2=None):  # noqa: pylint - unused-argument
+            return {}
 
-        response = handler(event)
-        self.assertEqual(20, response)
+        response = handler("2019", var2="abba")
+        self.assertEqual({}, response)
 
-    def test_extract_missing_non_empty_parameter(self):
-        event = {
-            "a": 20
-        }
 
-        @extract([Parameter("/b", "event", validators=[NonEmpty])])
-        def handler(event, b=None):  # noqa: pylint - unused-argument
-            return b
+class HandleExceptionsTests(DecoratorsTestCase):
 
-        response = handler(event)
-        self.assertEqual(None, response)
+    def test_exception_handler_raises_exception(self):
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_non_empty_parameter_that_is_empty(self, mock_logger):
-        event = {
-            "a": {}
-        }
+        response = handle_exceptions(handlers=[ExceptionHandler(KeyError, "msg")])(raise_key_error)()
 
-        @extract([Parameter("/a", "event", validators=[NonEmpty])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return {}
+        self.assert_error_response(response, 400, {"message": "msg"})
 
-        response = handler(event, None)
+        self.assertEqual([("error", "%s: %s", "msg", "'blank'")], self.log_spy.calls)
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"a\": [\"Value is empty\"]}]}",
-            response["body"])
+    def test_exception_handler_raises_exception_without_friendly_message(self):
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"a": ["Value is empty"]}]
-        )
+        response = handle_exceptions(handlers=[ExceptionHandler(KeyError)])(raise_key_error)()
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_non_empty_parameter_that_is_empty_with_custom_message(self, mock_logger):
-        event = {
-            "a": {}
-        }
+        self.assert_error_response(response, 400, {"message": "'blank'"})
 
-        @extract([Parameter("/a", "event", validators=[NonEmpty("The value was empty")])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return {}
+        self.assertEqual([("error", "'blank'")], self.log_spy.calls)
 
-        response = handler(event, None)
+    def test_exception_handler_raises_exception_with_status_code(self):
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual(
-            "{\"message\": [{\"a\": [\"The value was empty\"]}]}",
-            response["body"])
+        response = handle_exceptions(handlers=[ExceptionHandler(KeyError, "error", 500)])(raise_key_error)()
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"a": ["The value was empty"]}]
-        )
+        self.assert_error_response(response, 500, {"message": "error"})
 
-    def test_extract_date_parameter(self):
-        event = {
-            "a": "2001-01-01 00:00:00"
-        }
+        self.assertEqual([("error", "%s: %s", "error", "'blank'")], self.log_spy.calls)
 
-        @extract([Parameter("/a", "event", validators=[DateValidator("%Y-%m-%d %H:%M:%S")])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return a
+    def test_exception_handler_raises_exception_with_inherited_exception(self):
 
-        response = handler(event)
-        self.assertEqual("2001-01-01 00:00:00", response)
+        response = handle_exceptions(handlers=[ExceptionHandler(Exception)])(raise_key_error)()
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_date_parameter_fails_on_invalid_date(self, mock_logger):
-        event = {
-            "a": "2001-01-01 35:00:00"
-        }
+        self.assert_error_response(response, 400, {"message": "'blank'"})
 
-        @extract([Parameter("/a", "event", validators=[DateValidator("%Y-%m-%d %H:%M:%S")])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return {}
+        self.assertEqual([("error", "'blank'")], self.log_spy.calls)
 
-        response = handler(event, None)
+    def test_handle_all_exceptions(self):
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"a\": [\"'2001-01-01 35:00:00' is not a '%Y-%m-%d %H:%M:%S' date\"]}]}",
-                         response["body"])
+        response = handle_all_exceptions()(raise_key_error)()
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"a": ["'2001-01-01 35:00:00' is not a '%Y-%m-%d %H:%M:%S' date"]}]
-        )
+        self.assert_error_response(response, 400, {"message": "'blank'"})
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_extract_date_parameter_fails_with_custom_error(self, mock_logger):
-        event = {
-            "a": "2001-01-01 35:00:00"
-        }
+        self.assertEqual([("error", "'blank'")], self.log_spy.calls)
 
-        @extract([Parameter("/a", "event", validators=[DateValidator("%Y-%m-%d %H:%M:%S", "Not a valid date!")])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return {}
 
-        response = handler(event, None)
+class LogTests(DecoratorsTestCase):
 
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"a\": [\"Not a valid date!\"]}]}", response["body"])
+    def test_log_decorator_can_log_params(self):
 
-        mock_logger.error.assert_called_once_with(
-            "Error validating parameters. Errors: %s",
-            [{"a": ["Not a valid date!"]}]
-        )
+        @log(True, False)
+        def handler(event, context, an_other):  # noqa
+            return {}
 
-    def test_extract_date_parameter_valid_on_empty(self):
-        event = {
-            "a": None
-        }
+        handler("first", "{\"tests\": \"a\"}", "another")
 
-        @extract([Parameter("/a", "event", validators=[DateValidator("%Y-%m-%d %H:%M:%S")])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return a
+        self.assertEqual([(
+            "info",
+            "Function: %s, Parameters: %s", "handler", ("first", "{\"tests\": \"a\"}", "another")
+        )], self.log_spy.calls)
 
-        response = handler(event)
-        self.assertEqual(None, response)
+    def test_log_decorator_can_log_response(self):
 
-    def test_extract_currency_parameter(self):
-        event = {
-            "a": "GBP"
-        }
+        @log(False, True)
+        def handler():
+            return {"statusCode": 201}
 
-        @extract([Parameter("/a", "event", [CurrencyValidator])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return a
+        handler()
 
-        response = handler(event)
-        self.assertEqual("GBP", response)
+        self.assertEqual([("info", "Function: %s, Response: %s", "handler", {"statusCode": 201})], self.log_spy.calls)
 
-    def test_currency_validator_returns_true_when_none_is_passed_in(self):
-        path = "/a/b/c"
-        dictionary = {
-            "a": {
-                "b": {
-                    "c": None
-                }
-            }
-        }
 
-        @extract([Parameter(path, "event", [CurrencyValidator])])
-        def handler(event, c=None):  # noqa
-            return c
+class ResponseBodyAsJsonTests(DecoratorsTestCase):
 
-        response = handler(dictionary, None)
-        self.assertEqual(None, response)
+    def test_body_gets_dumped_as_json(self):
 
-    def test_currency_validator_returns_false_when_invalid_code_passed_in(self):
-        event = {
-            "a": "GBT"
-        }
+        @response_body_as_json
+        def handler():
+            return {"statusCode": 200, "body": {"a": "b"}}
 
-        @extract([Parameter("/a", "event", [CurrencyValidator])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return {}
+        response = handler()
 
-        response = handler(event)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": [{\"a\": [\"\'GBT\' is not a valid currency code.\"]}]}",
-                         response["body"])
+        self.assertEqual(response, {"statusCode": 200, "body": "{\"a\": \"b\"}"})
 
-    def test_currency_validator_can_be_called_non_statically(self):
-        event = {
-            "a": "GBP"
-        }
+    def test_body_dump_raises_exception_on_invalid_json(self):
 
-        @extract([Parameter("/a", "event", [CurrencyValidator()])])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return a
+        @response_body_as_json
+        def handler():
+            return {"statusCode": 200, "body": {"a"}}
 
-        response = handler(event)
-        self.assertEqual("GBP", response)
+        response = handler()
 
-    def test_can_apply_transformation(self):
-        event = {
-            "a": "2"
-        }
+        self.assert_error_response(response, 500, {"message": "Response body is not JSON serializable"})
 
-        @extract([Parameter("/a", "event", transform=float)])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return a
+    def test_response_as_json_invalid_application_does_nothing(self):
 
-        response = handler(event)
-        self.assertEqual(2, response)
+        @response_body_as_json
+        def handler():
+            return {"statusCode": 200}
 
-    def test_apply_transformation_on_none_value(self):
-        event = {
-            "a": None
-        }
+        response = handler()
 
-        @extract([Parameter("/a", "event", transform=float)])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return a
+        self.assertEqual(response, {"statusCode": 200})
 
-        response = handler(event)
-        self.assertEqual(None, response)
 
-    def test_apply_custom_transformation(self):
-        event = {
-            "a": "2"
-        }
+class CorsTests(DecoratorsTestCase):
 
-        def to_float(arg):
-            return float(arg)
+    def test_cors_adds_headers_to_response(self):
+        all_headers = {"allow_origin": "*", "allow_methods": "POST", "allow_headers": "Content-Type", "max_age": 12}
+        cases = [
+            (all_headers, {}, {
+                "headers": {
+                    ALLOW_HEADERS_HEADER: "Content-Type",
+                    ALLOW_METHODS_HEADER: "POST",
+                    ALLOW_ORIGIN_HEADER: "*",
+                    MAX_AGE_HEADER: 12
+                }
+            }),
+            ({"allow_origin": "*"}, {}, {
+                "headers": {
+                    ALLOW_ORIGIN_HEADER: "*"
+                }
+            }),
+            (all_headers, {
+                "headers": {
+                    "content-type": "application/json",
+                    ALLOW_ORIGIN_HEADER: "http://example.com"
+                }
+            }, {
+                "headers": {
+                    "content-type": "application/json",
+                    ALLOW_HEADERS_HEADER: "Content-Type",
+                    ALLOW_METHODS_HEADER: "POST",
+                    ALLOW_ORIGIN_HEADER: "http://example.com,*",
+                    MAX_AGE_HEADER: 12
+                }
+            }),
+            ({"allow_origin": None}, {
+                "headers": {
+                    ALLOW_ORIGIN_HEADER: "http://example.com"
+                }
+            }, {
+                "headers": {
+                    ALLOW_ORIGIN_HEADER: "http://example.com"
+                }
+            }),
+            ({"allow_origin": ""}, {
+                "headers": {
+                    ALLOW_ORIGIN_HEADER: "http://example.com"
+                }
+            }, {
+                "headers": {
+                    ALLOW_ORIGIN_HEADER: "http://example.com"
+                }
+            }),
+            (all_headers, {
+                "Headers": {
+                    "content-type": "application/json",
+                    "Access-Control-Allow-Origin": "http://example.com"
+                }
+            }, {
+                "Headers": {
+                    "content-type": "application/json",
+                    ALLOW_HEADERS_HEADER: "Content-Type",
+                    ALLOW_METHODS_HEADER: "POST",
+                    "Access-Control-Allow-Origin": "http://example.com,*",
+                    MAX_AGE_HEADER: 12
+                }
+            })
+        ]
 
-        @extract([Parameter("/a", "event", transform=to_float)])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return a
+        for cors_kwargs, handler_response, expected in cases:
+            with self.subTest(cors_kwargs=cors_kwargs, handler_response=handler_response):
+                response = cors(**cors_kwargs)(handler_returning(handler_response))()
+                self.assertEqual(expected, response)
 
-        response = handler(event)
-        self.assertEqual(2, response)
+    def test_cors_invalid_max_age_logs_error(self):
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_apply_custom_transformation_with_error_handling(self, mock_logger):
-        event = {
-            "a": "abc"
-        }
+        response = cors(max_age="12")(empty_handler)()
 
-        def to_float(arg):
-            try:
-                return float(arg)
-            except Exception:
-                raise Exception(f"Custom error message: value '{arg}' cannot be converted to float")
+        self.assert_error_response(response, 500, {"message": "Invalid value type in CORS header"})
 
-        @extract([Parameter("/a", "event", transform=to_float)])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return {}
+        self.assertEqual([(
+            "error",
+            "Cannot set %s header to a non %s value",
+            MAX_AGE_HEADER,
+            int
+        )], self.log_spy.calls)
 
-        response = handler(event)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": \"Error extracting parameters\"}", response["body"])
+    def test_cors_cannot_decorate_non_dict(self):
 
-        mock_logger.error.assert_called_once_with("%s: %s in argument %s for path %s",
-                                                  "Exception",
-                                                  "Custom error message: value 'abc' cannot be converted to float",
-                                                  "event",
-                                                  "/a")
+        response = cors(allow_origin="*")(non_dict_handler)()
 
-    @patch("aws_lambda_decorators.decorators.LOGGER")
-    def test_apply_invalid_transformation_raises_error(self, mock_logger):
-        event = {
-            "a": "abc"
-        }
+        self.assert_error_response(response, 500, {"message": "Invalid response type for CORS headers"})
 
-        @extract([Parameter("/a", "event", transform=float)])
-        def handler(event, a=None):  # noqa: pylint - unused-argument
-            return {}
+        self.assertEqual([("error", "Cannot add headers to a non dictionary response")], self.log_spy.calls)
 
-        response = handler(event)
-        self.assertEqual(400, response["statusCode"])
-        self.assertEqual("{\"message\": \"Error extracting parameters\"}", response["body"])
 
-        mock_logger.error.assert_called_once_with("%s: %s in argument %s for path %s",
-                                                  "ValueError",
-                                                  "could not convert string to float: 'abc'",
-                                                  "event",
-                                                  "/a")
+class PushWebsocketTests(DecoratorsTestCase):
 
     @patch("boto3.client")
     def test_push_ws_errors_missing_parameter(self, mock_boto3_client):
@@ -1970,36 +1320,90 @@ class DecoratorsTests(unittest.TestCase):  # noqa: pylint - too-many-public-meth
 
         mock_boto3_client.return_value.post_to_connection.assert_not_called()
 
-    def test_hsts_returns_headers_in_response(self):
 
-        @hsts()
-        def handler():
-            return {}
+class HstsTests(DecoratorsTestCase):
 
-        response = handler()
+    def test_hsts_returns_headers_in_response(self):
+
+        response = hsts()(empty_handler)()
 
         self.assertEqual(response["headers"]["Strict-Transport-Security"], "max-age=63072000")
 
     def test_hsts_returns_headers_in_response_with_custom_age(self):
 
-        @hsts(max_age=121212)
-        def handler():
-            return {}
-
-        response = handler()
+        response = hsts(max_age=121212)(empty_handler)()
 
         self.assertEqual(response["headers"]["Strict-Transport-Security"], "max-age=121212")
 
     def test_hsts_function_returns_non_dictionary(self):
 
-        @hsts()
-        def handler():
-            return "I am a string"
+        response = hsts()(non_dict_handler)()
 
-        response = handler()
+        self.assert_error_response(
+            response, HTTPStatus.INTERNAL_SERVER_ERROR,
+            {"message": "Invalid response type for HSTS header"})
+
+
+class ExtractFromSSMTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.boto_client_patcher = patch("boto3.client")
+        cls.mock_boto_client = cls.boto_client_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.boto_client_patcher.stop()
+
+    def setUp(self):
+        self.mock_boto_client.reset_mock(return_value=True)
+
+    def test_get_valid_ssm_parameter(self):
+        self.mock_boto_client.return_value = FakeSSMClient(response=SSM_KEY_RESPONSE)
+
+        @extract_from_ssm([SSMParameter("key")])
+        def handler(key=None):
+            return key
+
+        self.assertEqual(handler(), "tests")
+
+    def test_get_valid_ssm_parameter_custom_name(self):
+        self.mock_boto_client.return_value = FakeSSMClient(response=SSM_KEY_RESPONSE)
+
+        @extract_from_ssm([SSMParameter("key", "custom")])
+        def handler(custom=None):
+            return custom
+
+        self.assertEqual(handler(), "tests")
+
+    def test_get_valid_ssm_parameters(self):
+        self.mock_boto_client.return_value = FakeSSMClient(response=SSM_KEYS_RESPONSE)
+
+        @extract_from_ssm([SSMParameter("key1", "key1"), SSMParameter("key2", "key2")])
+        def handler(key1=None, key2=None):
+            return [key1, key2]
+
+        self.assertEqual(handler(), ["test1", "test2"])
+
+    def test_get_ssm_parameter_missing_parameter_raises_client_error(self):
+        self.mock_boto_client.return_value = FakeSSMClient(error=ClientError({}, ""))
+
+        @extract_from_ssm([SSMParameter("")])
+        def handler(key=None):
+            return key
+
+        with self.assertRaises(ClientError):
+            handler()
+
+    def test_get_ssm_parameter_empty_key_container_raises_key_error(self):
+        self.mock_boto_client.return_value = FakeSSMClient(response={})
+
+        @extract_from_ssm([SSMParameter("")])
+        def handler(key=None):
+            return key
 
-        self.assertEqual(response["statusCode"], HTTPStatus.INTERNAL_SERVER_ERROR)  # noqa: pylint-invalid-sequence-index
-        self.assertEqual(response["body"], "{\"message\": \"Invalid response type for HSTS header\"}")  # noqa: pylint-invalid-sequence-index
+        with self.assertRaises(KeyError):
+            handler()
 
 
 class IsolatedDecoderTests(unittest.TestCase):
@@ -2025,7 +1429,7 @@ class IsolatedDecoderTests(unittest.TestCase):
         self.assertEqual(HTTPStatus.BAD_REQUEST, response["statusCode"])
 
     def test_02_extract_from_event_200(self):
-        test_id = str(uuid4())
+        test_id = "3d2e2f5a-8b4e-4c1a-9f6d-2a7b1c0e5d43"
 
         event = {
             "pathParameters": {
@@ -7,11 +7,11 @@ class ParamTests(unittest.TestCase):
     def test_annotations_from_key_returns_none_when_no_annotations(self):
         key = "simple"
         response = Parameter.get_annotations_from_key(key)
-        self.assertTrue(response[0] == "simple")
-        self.assertTrue(response[1] is None)
+        self.assertEqual("simple", response[0])
+        self.assertIsNone(response[1])
 
     def test_annotations_from_key_returns_annotation(self):
         key = "simple[annotation]"
         response = Parameter.get_annotations_from_key(key)
-        self.assertTrue(response[0] == "simple")
-        self.assertTrue(response[1] == "annotation")
+        self.assertEqual("simple", response[0])
+        self.assertEqual("annotation", response[1])